@@ -65,7 +65,17 @@ def _run(connection: "Connection") -> None:
         compare_type=True,
     )
     with context.begin_transaction():
+        migration_context = context.get_context()
+        before = migration_context.get_current_heads()
         context.run_migrations()
+        # Schema changes and bulk data migrations leave sqlite_stat1 stale,
+        # and the planner can fall back to full scans. Refresh the statistics
+        # once per run that actually moved the revision.
+        if (
+            connection.dialect.name == "sqlite"
+            and migration_context.get_current_heads() != before
+        ):
+            connection.exec_driver_sql("ANALYZE")
 
 
 def run_migrations_online() -> None:
@@ -74,6 +84,16 @@ def run_migrations_online() -> None:
         _run(connection)
         return
 
+    if not os.environ.get("MANADJ_DB_URL"):
+        # The app DB: borrow the app's engine so migrations run under the
+        # same connection pragmas (WAL, synchronous=NORMAL; backend/database.py)
+        # and leave a warm pooled connection behind for startup.
+        from backend.database import engine as app_engine
+
+        with app_engine.connect() as conn:
+            _run(conn)
+        return
+
     engine = create_engine(_database_url())
     with engine.connect() as conn:
         _run(conn)
@@ -0,0 +1,35 @@
+"""track-filter-indexes
+
+Revision ID: 0028_vqkxtzlm
+Revises: 0027_mqqzn
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0028_vqkxtzlm'
+down_revision: Union[str, Sequence[str], None] = '0027_mqqzn'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index the library-view filter predicates (crud.get_tracks).
+
+    Energy (+ BPM window) and key filters were full scans of tracks; the
+    tag filter gets a (tag_id, track_id) covering index.
+    """
+    op.create_index("idx_tracks_energy_bpm", "tracks", ["energy", "bpm"])
+    op.create_index("idx_tracks_key", "tracks", ["key"])
+    op.create_index("idx_track_tags_tag_track", "track_tags", ["tag_id", "track_id"])
+
+
+def downgrade() -> None:
+    """Drop the filter indexes."""
+    op.drop_index("idx_track_tags_tag_track", table_name="track_tags")
+    op.drop_index("idx_tracks_key", table_name="tracks")
+    op.drop_index("idx_tracks_energy_bpm", table_name="tracks")
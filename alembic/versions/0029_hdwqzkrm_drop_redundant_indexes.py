@@ -0,0 +1,43 @@
+"""drop-redundant-indexes
+
+Revision ID: 0029_hdwqzkrm
+Revises: 0028_vqkxtzlm
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0029_hdwqzkrm'
+down_revision: Union[str, Sequence[str], None] = '0028_vqkxtzlm'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop single-column indexes a composite already covers; index BPM.
+
+    Each is a left prefix of another index on the same table (or, for
+    tracks.file_hash, never queried), so it only costs a B-tree write per
+    insert.
+    """
+    op.drop_index("idx_track_tags_track", table_name="track_tags")
+    op.drop_index("idx_track_tags_tag", table_name="track_tags")
+    op.drop_index("idx_playlist_tracks_playlist", table_name="playlist_tracks")
+    op.drop_index("idx_set_entries_set", table_name="set_entries")
+    op.drop_index("ix_tracks_file_hash", table_name="tracks")
+    # BPM-leading twin of idx_tracks_energy_bpm for BPM-only windows/sorts.
+    op.create_index("idx_tracks_bpm_energy", "tracks", ["bpm", "energy"])
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes."""
+    op.drop_index("idx_tracks_bpm_energy", table_name="tracks")
+    op.create_index("ix_tracks_file_hash", "tracks", ["file_hash"])
+    op.create_index("idx_set_entries_set", "set_entries", ["set_id"])
+    op.create_index("idx_playlist_tracks_playlist", "playlist_tracks", ["playlist_id"])
+    op.create_index("idx_track_tags_tag", "track_tags", ["tag_id"])
+    op.create_index("idx_track_tags_track", "track_tags", ["track_id"])
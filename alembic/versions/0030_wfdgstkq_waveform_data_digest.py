@@ -0,0 +1,46 @@
+"""waveform-data-digest
+
+Revision ID: 0030_wfdgstkq
+Revises: 0029_hdwqzkrm
+Create Date: 2026-10-16
+
+"""
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0030_wfdgstkq'
+down_revision: Union[str, Sequence[str], None] = '0029_hdwqzkrm'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store each Waveform data blob's content digest (its ETag).
+
+    Computed at write time so serving and revalidating never hash the blob;
+    existing blobs are digested here, one row at a time.
+    """
+    op.add_column("waveforms", sa.Column("data_digest", sa.String(), nullable=True))
+
+    bind = op.get_bind()
+    ids = bind.execute(
+        sa.text("SELECT id FROM waveforms WHERE data_blob IS NOT NULL")
+    ).scalars().all()
+    for waveform_id in ids:
+        blob = bind.execute(
+            sa.text("SELECT data_blob FROM waveforms WHERE id = :id"), {"id": waveform_id}
+        ).scalar()
+        bind.execute(
+            sa.text("UPDATE waveforms SET data_digest = :digest WHERE id = :id"),
+            {"digest": hashlib.blake2b(blob, digest_size=16).hexdigest(), "id": waveform_id},
+        )
+
+
+def downgrade() -> None:
+    """Drop the digest column."""
+    op.drop_column("waveforms", "data_digest")
@@ -8,7 +8,7 @@ metadata (a seed for placeholder-grid generation).
 
 import json
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 
 from backend import models
 from backend.beatgrid_utils import (
@@ -122,6 +122,9 @@ def backfill_bpm_from_grids(db: Session) -> int:
         db.query(models.Track)
         .join(models.Beatgrid, models.Beatgrid.track_id == models.Track.id)
         .filter(models.Beatgrid.origin != "generated")
+        # bpm_projected reads track.beatgrid: populate it from this join
+        # rather than one lazy SELECT per track.
+        .options(contains_eager(models.Track.beatgrid))
         .all()
     )
     for track in tracks:
@@ -1,5 +1,10 @@
 """Beat calculation utilities for beatgrid generation."""
 
+import json
+from functools import lru_cache
+
+import numpy as np
+
 
 def calculate_beats_from_tempo_changes(tempo_changes: list[dict], duration: float) -> tuple[list[float], list[float]]:
     """
@@ -32,23 +37,29 @@ def calculate_beats_from_tempo_changes(tempo_changes: list[dict], duration: floa
     for i, tc in enumerate(tempo_changes):
         beat_interval = 60.0 / tc["bpm"]  # seconds per beat
         time_sig_num = tc["time_signature_num"]
-        next_start = (
-            tempo_changes[i + 1]["start_time"] if i + 1 < len(tempo_changes) else None
-        )
-
-        current_time = tc["start_time"]
-        current_bar_position = tc["bar_position"]
-
-        while current_time <= duration:
-            if next_start is not None and current_time >= next_start - beat_interval / 2:
-                break  # the boundary beat belongs to the next segment
-            beat_times.append(current_time)
+        start_time = tc["start_time"]
 
-            if current_bar_position == 1:
-                downbeat_times.append(current_time)
-
-            current_time += beat_interval
-            current_bar_position = (current_bar_position % time_sig_num) + 1
+        # The boundary beat belongs to the next segment
+        boundary = (
+            tempo_changes[i + 1]["start_time"] - beat_interval / 2
+            if i + 1 < len(tempo_changes) else None
+        )
+        limit = duration if boundary is None else min(duration, boundary)
+        n = max(0, int((limit - start_time) / beat_interval) + 2)
+
+        # cumsum accumulates left to right, reproducing the repeated
+        # `t += interval` floats exactly (a multiply would drift by an ulp)
+        steps = np.full(n, beat_interval)
+        steps[:1] = start_time
+        times = np.cumsum(steps)
+        keep = times <= duration
+        if boundary is not None:
+            keep &= times < boundary
+        times = times[keep]
+
+        positions = (np.arange(len(times)) + (tc["bar_position"] - 1)) % time_sig_num
+        beat_times.extend(times.tolist())
+        downbeat_times.extend(times[positions == 0].tolist())
 
     return beat_times, downbeat_times
 
@@ -70,6 +81,42 @@ def constant_tempo_changes(
     }]
 
 
+@lru_cache(maxsize=4096)
+def _beatgrid_cached(bpm: float, duration: float) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Beat expansion of a constant grid, memoized on (bpm, duration).
+
+    Placeholder grids are a pure function of the bpm column and the
+    waveform duration, and get recomputed on every read (ADR 0027 §3).
+    Tuples so the cached value can't be mutated through a caller's list.
+    """
+    beat_times, downbeat_times = calculate_beats_from_tempo_changes(
+        constant_tempo_changes(bpm), duration
+    )
+    return tuple(beat_times), tuple(downbeat_times)
+
+
+@lru_cache(maxsize=4096)
+def _stored_beats_cached(tempo_changes_json: str, duration: float) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Beat expansion of a stored grid, memoized on its tempo_changes_json.
+
+    The serialized map is the key, so any edit to the grid misses the cache
+    on its own; nothing needs invalidating.
+    """
+    beat_times, downbeat_times = calculate_beats_from_tempo_changes(
+        json.loads(tempo_changes_json), duration
+    )
+    return tuple(beat_times), tuple(downbeat_times)
+
+
+def calculate_beats_from_tempo_changes_json(
+    tempo_changes_json: str, duration: float
+) -> tuple[list[float], list[float]]:
+    """calculate_beats_from_tempo_changes for a stored grid's
+    tempo_changes_json, cached across reads of an unchanged grid."""
+    beat_times, downbeat_times = _stored_beats_cached(tempo_changes_json, duration)
+    return list(beat_times), list(downbeat_times)
+
+
 def generate_beatgrid_from_bpm(bpm: float, duration: float) -> dict:
     """
     Generate beatgrid data from a single BPM value.
@@ -81,14 +128,12 @@ def generate_beatgrid_from_bpm(bpm: float, duration: float) -> dict:
     Returns:
         Dict with tempo_changes, beat_times, downbeat_times
     """
-    tempo_changes = constant_tempo_changes(bpm)
-
-    beat_times, downbeat_times = calculate_beats_from_tempo_changes(tempo_changes, duration)
+    beat_times, downbeat_times = _beatgrid_cached(bpm, duration)
 
     return {
-        "tempo_changes": tempo_changes,
-        "beat_times": beat_times,
-        "downbeat_times": downbeat_times
+        "tempo_changes": constant_tempo_changes(bpm),
+        "beat_times": list(beat_times),
+        "downbeat_times": list(downbeat_times)
     }
 
 
@@ -121,11 +166,8 @@ def set_downbeat_at_time(
 
     # Calculate bar position for first beat
     # User wants their beat to be position 1, count backward with wrapping
-    beats_within_bar = num_beats_back % time_signature_num
-    if beats_within_bar == 0:
-        first_bar_position = 1  # Also a downbeat
-    else:
-        first_bar_position = time_signature_num - beats_within_bar + 1
+    # (a whole number of bars back lands on 1, i.e. also a downbeat)
+    first_bar_position = (time_signature_num - num_beats_back) % time_signature_num + 1
 
     return [{
         "start_time": first_beat_time,
@@ -165,6 +207,9 @@ def nudge_beatgrid(
     first_start = tempo_changes[0]["start_time"]
     new_first_start = max(-0.1, min(track_duration, first_start + offset_s))
     applied_offset_s = new_first_start - first_start
+    if applied_offset_s == 0.0:
+        # Zero nudge (snap) or fully clamped at an edge: nothing moves
+        return list(tempo_changes), 0.0
 
     new_tempo_changes = [
         {**tc, "start_time": tc["start_time"] + applied_offset_s}
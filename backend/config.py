@@ -64,6 +64,9 @@ class Config:
     acquisition: AcquisitionConfig
 
 
+CONFIG_PATH = Path(__file__).parent.parent / "config.toml"
+
+
 def _load_dotenv() -> None:
     """Load KEY=VALUE lines from repo-root .env into the environment.
 
@@ -132,9 +135,8 @@ def load_config() -> Config:
         FileNotFoundError: If config.toml doesn't exist
     """
     _load_dotenv()
-    config_path = Path(__file__).parent.parent / "config.toml"
 
-    if not config_path.exists():
+    if not CONFIG_PATH.exists():
         # Return default empty config if file doesn't exist
         return Config(
             database=DatabaseConfig(
@@ -149,7 +151,7 @@ def load_config() -> Config:
             acquisition=AcquisitionConfig()
         )
 
-    with open(config_path, "rb") as f:
+    with open(CONFIG_PATH, "rb") as f:
         data = tomllib.load(f)
 
     # Parse database config
@@ -184,19 +186,33 @@ def load_config() -> Config:
     )
 
 
-# Global config instance
+# Global config instance, and the config.toml mtime it was parsed from
+# (None = no file)
 _config: Config | None = None
+_config_mtime: float | None = None
+
+
+def _config_file_mtime() -> float | None:
+    try:
+        return os.stat(CONFIG_PATH).st_mtime
+    except FileNotFoundError:
+        return None
 
 
 def get_config() -> Config:
     """Get or load the global config instance.
 
+    Cached; re-parsed only when config.toml's mtime changes (one stat per
+    call), so edits apply without a restart.
+
     Returns:
-        Config object (cached after first load)
+        Config object
     """
-    global _config
-    if _config is None:
+    global _config, _config_mtime
+    mtime = _config_file_mtime()
+    if _config is None or mtime != _config_mtime:
         _config = load_config()
+        _config_mtime = mtime
     return _config
 
 
@@ -206,6 +222,7 @@ def reload_config() -> Config:
     Returns:
         Newly loaded Config object
     """
-    global _config
+    global _config, _config_mtime
+    _config_mtime = _config_file_mtime()
     _config = load_config()
     return _config
@@ -1,8 +1,8 @@
 """CRUD operations for database."""
 
 import json
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import case, insert, or_, update
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.sql import func
 from . import models, schemas
 from .beatgrid_utils import generate_beatgrid_from_bpm
@@ -11,10 +11,7 @@ from .track_metadata.units import bpm_to_centibpm, centibpm_to_bpm
 
 
 # Tracks
-def get_tracks(
-    db: Session,
-    skip: int = 0,
-    limit: int = 100,
+def _track_filters(
     tag_ids: list[int] | None = None,
     search: str | None = None,
     energy_min: int | None = None,
@@ -26,28 +23,26 @@ def get_tracks(
     unprocessed: bool | None = None,
     needs_attention: bool | None = None,
     archived: bool = False,
-    sort_column: str | None = None,
-    sort_direction: str = "desc"
-):
-    query = db.query(models.Track).options(
-        joinedload(models.Track.track_tags).joinedload(models.TrackTag.tag).joinedload(models.Tag.category),
-        # served bpm reads the grid (ADR 0027) — eager, not N+1 lazy loads.
-        joinedload(models.Track.beatgrid),
-        # needs_attention reads the analysis diagnostics (ADR 0024) — same.
-        joinedload(models.Track.grid_analysis),
-    )
+) -> list:
+    """WHERE predicates for a library listing (get_tracks).
+
+    Every predicate is on tracks itself (tag filters are EXISTS, never a
+    join), so the same list serves the page query and a plain count —
+    counting never drags the eager-loaded joins along.
+    """
+    filters = []
 
     # Archived (CONTEXT.md): out of the active Library. Default listings
     # exclude archived Tracks; archived=True lists ONLY them (the Archived view).
     if archived:
-        query = query.filter(~models.Track.is_active)
+        filters.append(~models.Track.is_active)
     else:
-        query = query.filter(models.Track.is_active)
+        filters.append(models.Track.is_active)
 
     # Text search on filename, title, or artist
     if search:
         pattern = f"%{search}%"
-        query = query.filter(
+        filters.append(
             or_(
                 models.Track.filename.ilike(pattern),
                 models.Track.title.ilike(pattern),
@@ -58,42 +53,40 @@ def get_tracks(
     # Energy range filter
     # When range is full (1-5), include tracks with null energy
     # Otherwise, only include tracks with energy in the specified range
-    if energy_min is not None or energy_max is not None:
-        if energy_min == 1 and energy_max == 5:
-            # Full range - include null energy tracks
-            pass
-        else:
-            # Partial range - exclude null energy tracks
-            if energy_min is not None:
-                query = query.filter(models.Track.energy >= energy_min, models.Track.energy.isnot(None))
-            if energy_max is not None:
-                query = query.filter(models.Track.energy <= energy_max, models.Track.energy.isnot(None))
+    # (SQL comparisons are never true for NULL, so null energy drops out)
+    if (energy_min, energy_max) != (1, 5):
+        if energy_min is not None:
+            filters.append(models.Track.energy >= energy_min)
+        if energy_max is not None:
+            filters.append(models.Track.energy <= energy_max)
 
     # Unprocessed tracks filter - tracks with no tags OR no energy
     if unprocessed:
-        query = query.filter(
+        filters.append(
             (models.Track.energy.is_(None)) |
             (~models.Track.track_tags.any())
         )
 
     # Needs-attention worklist (ADR 0024): analysis bailed, no saved grid
     if needs_attention:
-        query = query.filter(models.Track.needs_attention)
+        filters.append(models.Track.needs_attention)
 
     # Tag filtering with ANY/ALL logic
     if tag_ids:
         if tag_match_mode == "ALL":
             # ALL logic: Track must have all specified tags
             for tag_id in tag_ids:
-                query = query.filter(
+                filters.append(
                     models.Track.track_tags.any(
                         models.TrackTag.tag_id == tag_id
                     )
                 )
         else:  # ANY logic (default)
-            # ANY logic: Track must have at least one specified tag
-            query = query.join(models.TrackTag).filter(
-                models.TrackTag.tag_id.in_(tag_ids)
+            # ANY logic: Track must have at least one specified tag. EXISTS,
+            # not a join — a join yields one row per matching tag, which
+            # inflates the count and eats into the page limit.
+            filters.append(
+                models.Track.track_tags.any(models.TrackTag.tag_id.in_(tag_ids))
             )
 
     # BPM range filter
@@ -107,28 +100,70 @@ def get_tracks(
         bpm_min_centi = int(bpm_min * 100)
         bpm_max_centi = int(bpm_max * 100)
 
-        # Filter tracks within range (exclude NULL bpm). The centibpm
-        # column is internal-only (ADR 0027): it exists so SQL sort/filter
-        # work without parsing grid JSON, kept honest by compliant writers.
-        query = query.filter(
-            models.Track.bpm >= bpm_min_centi,
-            models.Track.bpm <= bpm_max_centi,
-            models.Track.bpm.isnot(None)
-        )
+        # Filter tracks within range (NULL bpm never compares true). The
+        # centibpm column is internal-only (ADR 0027): it exists so SQL
+        # sort/filter work without parsing grid JSON, kept honest by
+        # compliant writers.
+        filters.append(models.Track.bpm.between(bpm_min_centi, bpm_max_centi))
 
     # Key filter (ANY match) - convert OpenKey to Engine DJ IDs
     if key_camelot_ids:
-        from .key import Key
+        from .key import OPENKEY_TO_ENGINE_ID
 
-        # Convert OpenKey notation to Engine DJ IDs
-        key_ids = []
-        for openkey in key_camelot_ids:
-            key_obj = Key.from_openkey(openkey)
-            if key_obj and key_obj.engine_id is not None:
-                key_ids.append(key_obj.engine_id)
+        # Convert OpenKey notation to Engine DJ IDs (unknown notations dropped)
+        key_ids = [
+            OPENKEY_TO_ENGINE_ID[openkey]
+            for openkey in key_camelot_ids
+            if openkey in OPENKEY_TO_ENGINE_ID
+        ]
 
         if key_ids:
-            query = query.filter(models.Track.key.in_(key_ids))
+            filters.append(models.Track.key.in_(key_ids))
+
+    return filters
+
+
+def get_tracks(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    tag_ids: list[int] | None = None,
+    search: str | None = None,
+    energy_min: int | None = None,
+    energy_max: int | None = None,
+    tag_match_mode: str = "ANY",
+    bpm_center: float | None = None,
+    bpm_threshold_percent: int | None = None,
+    key_camelot_ids: list[str] | None = None,
+    unprocessed: bool | None = None,
+    needs_attention: bool | None = None,
+    archived: bool = False,
+    sort_column: str | None = None,
+    sort_direction: str = "desc"
+):
+    filters = _track_filters(
+        tag_ids=tag_ids,
+        search=search,
+        energy_min=energy_min,
+        energy_max=energy_max,
+        tag_match_mode=tag_match_mode,
+        bpm_center=bpm_center,
+        bpm_threshold_percent=bpm_threshold_percent,
+        key_camelot_ids=key_camelot_ids,
+        unprocessed=unprocessed,
+        needs_attention=needs_attention,
+        archived=archived,
+    )
+
+    query = db.query(models.Track).options(
+        # Tags via one extra IN query rather than a join that multiplies
+        # every track row by its tag count.
+        selectinload(models.Track.track_tags).joinedload(models.TrackTag.tag).joinedload(models.Tag.category),
+        # served bpm reads the grid (ADR 0027) — eager, not N+1 lazy loads.
+        joinedload(models.Track.beatgrid),
+        # needs_attention reads the analysis diagnostics (ADR 0024) — same.
+        joinedload(models.Track.grid_analysis),
+    ).filter(*filters)
 
     # Apply sorting
     if sort_column == "provenance":
@@ -154,13 +189,9 @@ def get_tracks(
         # Default sort: newest first
         query = query.order_by(models.Track.created_at.desc())
 
-    total = query.count()
+    total = db.query(func.count(models.Track.id)).filter(*filters).scalar()
     items = query.offset(skip).limit(limit).all()
 
-    # Convert to schema format with tags list
-    for item in items:
-        item.tags = [tt.tag for tt in item.track_tags]
-
     # Total ACTIVE library size (archived Tracks are out of the Library)
     total_library_size = (
         db.query(models.Track).filter(models.Track.is_active).count()
@@ -220,16 +251,11 @@ def unarchive_track(db: Session, track_id: int):
 
 
 def get_track(db: Session, track_id: int):
-    track = db.query(models.Track).options(
+    return db.query(models.Track).options(
         joinedload(models.Track.track_tags).joinedload(models.TrackTag.tag).joinedload(models.Tag.category),
         joinedload(models.Track.beatgrid),
     ).filter(models.Track.id == track_id).first()
 
-    if track:
-        track.tags = [tt.tag for tt in track.track_tags]
-
-    return track
-
 
 def get_all_tracks(db: Session):
     """Get all tracks without pagination."""
@@ -280,10 +306,14 @@ def update_track_tags(db: Session, track_id: int, tag_ids: list[int]):
     # Remove existing tags
     db.query(models.TrackTag).filter(models.TrackTag.track_id == track_id).delete()
 
-    # Add new tags (deduplicate to prevent duplicates)
-    for tag_id in set(tag_ids):
-        track_tag = models.TrackTag(track_id=track_id, tag_id=tag_id)
-        db.add(track_tag)
+    # Add new tags (deduplicate to prevent duplicates) in one batched INSERT
+    # rather than a flush per TrackTag.
+    unique_tag_ids = set(tag_ids)
+    if unique_tag_ids:
+        db.execute(
+            insert(models.TrackTag),
+            [{"track_id": track_id, "tag_id": tag_id} for tag_id in unique_tag_ids],
+        )
 
     db.commit()
     db.refresh(track)
@@ -378,15 +408,23 @@ def delete_tag(db: Session, tag_id: int):
 
 def reorder_tags(db: Session, tag_order: list[dict]):
     """Update display_order for multiple tags."""
-    for item in tag_order:
-        tag = db.query(models.Tag).filter(models.Tag.id == item['id']).first()
-        if tag:
-            tag.display_order = item['display_order']
-
+    _bulk_set_display_order(db, models.Tag, {item['id']: item['display_order'] for item in tag_order})
     db.commit()
     return True
 
 
+def _bulk_set_display_order(db: Session, model, display_order: dict[int, int]) -> None:
+    """Set display_order for many rows (id -> order) in one UPDATE ... CASE.
+    Unknown ids match nothing and are ignored, as before."""
+    if not display_order:
+        return
+    db.execute(
+        update(model)
+        .where(model.id.in_(display_order))
+        .values(display_order=case(display_order, value=model.id))
+    )
+
+
 # Waveforms
 def get_waveform(db: Session, track_id: int):
     """Get waveform for a track."""
@@ -451,17 +489,19 @@ def get_playlist_with_tracks(db: Session, playlist_id: int):
     if not playlist:
         return None
 
-    # Get tracks in order via playlist_tracks junction
-    playlist_tracks = db.query(models.PlaylistTrack).filter(
-        models.PlaylistTrack.playlist_id == playlist_id
-    ).order_by(models.PlaylistTrack.position).all()
-
-    # Load full track data with tags
-    tracks = []
-    for pt in playlist_tracks:
-        track = get_track(db, pt.track_id)
-        if track:
-            tracks.append(track)
+    # Load full track data with tags in order via the playlist_tracks
+    # junction — one query (plus the tag IN load), not one get_track per entry
+    tracks = (
+        db.query(models.Track)
+        .join(models.PlaylistTrack, models.PlaylistTrack.track_id == models.Track.id)
+        .options(
+            selectinload(models.Track.track_tags).joinedload(models.TrackTag.tag).joinedload(models.Tag.category),
+            joinedload(models.Track.beatgrid),
+        )
+        .filter(models.PlaylistTrack.playlist_id == playlist_id)
+        .order_by(models.PlaylistTrack.position)
+        .all()
+    )
 
     # Attach tracks to playlist object
     playlist.tracks = tracks
@@ -601,9 +641,14 @@ def reorder_playlist_tracks(db: Session, playlist_id: int, track_positions: list
     if sorted(tp.position for tp in track_positions) != list(range(len(entries))):
         raise ValueError("reorder positions must be exactly 0..n-1")
 
+    # One UPDATE ... CASE for the whole permutation, not one per entry
     new_position = {tp.track_id: tp.position for tp in track_positions}
-    for entry in entries:
-        entry.position = new_position[entry.track_id]
+    if new_position:
+        db.execute(
+            update(models.PlaylistTrack)
+            .where(models.PlaylistTrack.playlist_id == playlist_id)
+            .values(position=case(new_position, value=models.PlaylistTrack.track_id))
+        )
 
     db.commit()
     return get_playlist_with_tracks(db, playlist_id)
@@ -611,13 +656,9 @@ def reorder_playlist_tracks(db: Session, playlist_id: int, track_positions: list
 
 def reorder_playlists(db: Session, playlist_order: list[schemas.PlaylistOrderItem]):
     """Update display_order for multiple playlists."""
-    for item in playlist_order:
-        playlist = db.query(models.Playlist).filter(
-            models.Playlist.id == item.id
-        ).first()
-        if playlist:
-            playlist.display_order = item.display_order
-
+    _bulk_set_display_order(
+        db, models.Playlist, {item.id: item.display_order for item in playlist_order}
+    )
     db.commit()
     return True
 
@@ -630,6 +671,17 @@ def get_beatgrid(db: Session, track_id: int):
     ).first()
 
 
+def get_track_bundle(db: Session, track_id: int):
+    """(Track, Waveform | None, Beatgrid | None) for a track in one query,
+    or None when the track doesn't exist. The waveform blob stays deferred.
+    """
+    return db.query(models.Track, models.Waveform, models.Beatgrid).outerjoin(
+        models.Waveform, models.Waveform.track_id == models.Track.id
+    ).outerjoin(
+        models.Beatgrid, models.Beatgrid.track_id == models.Track.id
+    ).filter(models.Track.id == track_id).one_or_none()
+
+
 def compute_placeholder_beatgrid_data(db: Session, track_id: int) -> dict:
     """Placeholder beatgrid data as a pure projection of the bpm column
     (ADR 0027 §3) — computed, never persisted. Requires the waveform (for
@@ -637,13 +689,19 @@ def compute_placeholder_beatgrid_data(db: Session, track_id: int) -> dict:
     is missing.
     """
     track = get_track(db, track_id)
+    waveform = get_waveform(db, track_id) if track and track.bpm else None
+    return placeholder_beatgrid_data(track, waveform)
+
+
+def placeholder_beatgrid_data(track, waveform) -> dict:
+    """compute_placeholder_beatgrid_data for an already-loaded track and
+    waveform (either may be None); same errors."""
     if not track:
         raise ValueError("Track not found")
 
     if not track.bpm:
         raise ValueError("Track has no BPM set")
 
-    waveform = get_waveform(db, track_id)
     if not waveform:
         raise ValueError("Waveform must exist before generating beatgrid")
 
@@ -1,6 +1,6 @@
 """Database connection and session management."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from pathlib import Path
 
@@ -15,6 +15,28 @@ engine = create_engine(
     connect_args={"check_same_thread": False}
 )
 
+# Connection pragmas for the app DB. WAL drops the second fsync per commit
+# and lets the task worker write while requests read; NORMAL is durable
+# under WAL except across power loss. journal_mode is persistent in the
+# file, so backups copy through SQLite, not the file (scripts/agent/db_backup.py).
+# foreign_keys stays off: the ORM owns cascades (see models.py ondelete notes).
+_SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-65536",  # 64 MiB page cache
+    "mmap_size=268435456",  # 256 MiB
+)
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def get_db():
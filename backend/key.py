@@ -1,9 +1,11 @@
 """Unified musical key representation supporting multiple formats."""
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Key:
     """Immutable musical key representation supporting multiple formats.
 
@@ -49,6 +51,13 @@ class Key:
         23: ("Dm", "7A", "12m", 15),
     }
 
+    # Per-notation columns indexed by Engine DJ ID — the IDs are dense 0-23,
+    # so the properties index a tuple instead of hashing into the dict
+    _MUSICAL = tuple(v[0] for v in _ENGINE_TO_ALL.values())
+    _CAMELOT = tuple(v[1] for v in _ENGINE_TO_ALL.values())
+    _OPENKEY = tuple(v[2] for v in _ENGINE_TO_ALL.values())
+    _MIXXX = tuple(v[3] for v in _ENGINE_TO_ALL.values())
+
     # Reverse mappings
     _MUSICAL_TO_ENGINE = {v[0]: k for k, v in _ENGINE_TO_ALL.items()}
     _CAMELOT_TO_ENGINE = {v[1]: k for k, v in _ENGINE_TO_ALL.items()}
@@ -114,44 +123,26 @@ class Key:
     @classmethod
     def from_engine_id(cls, engine_id: int | None) -> "Key | None":
         """Create Key from Engine DJ ID (0-23)."""
-        if engine_id is None or engine_id not in cls._ENGINE_TO_ALL:
+        if engine_id is None:
             return None
-        return cls(_engine_id=engine_id)
+        return _KEYS.get(engine_id)
 
     @classmethod
     def from_musical(cls, key: str | None) -> "Key | None":
         """Create Key from musical notation (e.g., "C", "Am", "F#m").
 
-        Also handles OpenKey (e.g., "2m") and Camelot (e.g., "4A") formats.
+        Also handles OpenKey (e.g., "2m"), Camelot (e.g., "4A") and
+        enharmonic/alternative spellings (e.g., "Gb", "F Minor"); anything
+        else gets one retry through _normalize_musical ("c#min", "Fmaj").
         """
         if key is None:
             return None
-
-        # Try direct lookup
-        engine_id = cls._MUSICAL_TO_ENGINE.get(key)
-        if engine_id is not None:
-            return cls(_engine_id=engine_id)
-
-        # Try OpenKey format (e.g., "2m", "1d")
-        if key and (key.endswith('m') or key.endswith('d')) and len(key) >= 2:
-            maybe_openkey = cls.from_openkey(key)
-            if maybe_openkey is not None:
-                return maybe_openkey
-
-        # Try Camelot format (e.g., "4A", "8B")
-        if key and (key.endswith('A') or key.endswith('B')) and len(key) >= 2:
-            maybe_camelot = cls.from_camelot(key)
-            if maybe_camelot is not None:
-                return maybe_camelot
-
-        # Try enharmonic/alternative format equivalent
-        canonical = cls._ENHARMONIC.get(key)
-        if canonical:
-            engine_id = cls._MUSICAL_TO_ENGINE.get(canonical)
-            if engine_id is not None:
-                return cls(_engine_id=engine_id)
-
-        return None
+        engine_id = _ANY_TO_ENGINE.get(key)
+        if engine_id is None:
+            engine_id = _ANY_TO_ENGINE.get(_normalize_musical(key))
+            if engine_id is None:
+                return None
+        return _KEYS[engine_id]
 
     @classmethod
     def from_openkey(cls, openkey: str | None) -> "Key | None":
@@ -161,7 +152,7 @@ class Key:
         engine_id = cls._OPENKEY_TO_ENGINE.get(openkey)
         if engine_id is None:
             return None
-        return cls(_engine_id=engine_id)
+        return _KEYS[engine_id]
 
     @classmethod
     def from_camelot(cls, camelot: str | None) -> "Key | None":
@@ -171,7 +162,7 @@ class Key:
         engine_id = cls._CAMELOT_TO_ENGINE.get(camelot)
         if engine_id is None:
             return None
-        return cls(_engine_id=engine_id)
+        return _KEYS[engine_id]
 
     @classmethod
     def from_mixxx_id(cls, mixxx_id: int | None) -> "Key | None":
@@ -181,7 +172,7 @@ class Key:
         engine_id = cls._MIXXX_TO_ENGINE.get(mixxx_id)
         if engine_id is None:
             return None
-        return cls(_engine_id=engine_id)
+        return _KEYS[engine_id]
 
     @classmethod
     def from_rekordbox(cls, rb_key: str | None) -> "Key | None":
@@ -198,28 +189,28 @@ class Key:
         """Get musical notation (e.g., "C", "Am", "F#m")."""
         if self._engine_id is None:
             return None
-        return self._ENGINE_TO_ALL[self._engine_id][0]
+        return self._MUSICAL[self._engine_id]
 
     @property
     def camelot(self) -> str | None:
         """Get Camelot notation (e.g., "8B", "8A", "1B")."""
         if self._engine_id is None:
             return None
-        return self._ENGINE_TO_ALL[self._engine_id][1]
+        return self._CAMELOT[self._engine_id]
 
     @property
     def openkey(self) -> str | None:
         """Get OpenKey notation (e.g., "1d", "1m", "12d")."""
         if self._engine_id is None:
             return None
-        return self._ENGINE_TO_ALL[self._engine_id][2]
+        return self._OPENKEY[self._engine_id]
 
     @property
     def mixxx_id(self) -> int | None:
         """Get Mixxx ID (1-24)."""
         if self._engine_id is None:
             return None
-        return self._ENGINE_TO_ALL[self._engine_id][3]
+        return self._MIXXX[self._engine_id]
 
     @property
     def rekordbox(self) -> str | None:
@@ -245,3 +236,41 @@ class Key:
     def __hash__(self) -> int:
         """Hash based on Engine DJ ID."""
         return hash(self._engine_id)
+
+
+# Trailing major/minor word in any case and spacing: "C maj", "Ebmin", "a MINOR"
+_MODE_SUFFIX_RE = re.compile(r"\s*(?:(major|maj)|(minor|min))\s*$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_musical(key: str) -> str:
+    """Canonicalize free-form musical spellings from foreign tags: drop a
+    major suffix, turn a minor suffix into "m", capitalize the root.
+
+    Memoized: a library repeats a handful of odd spellings (and junk like
+    "Unknown") across thousands of tracks, and only misses reach here."""
+    key = _MODE_SUFFIX_RE.sub(lambda m: "m" if m.group(2) else "", key.strip())
+    return key[:1].upper() + key[1:]
+
+
+# Key is immutable, so every constructor hands out one shared instance per
+# Engine DJ ID instead of building a new dataclass per lookup.
+_KEYS: dict[int, Key] = {engine_id: Key(_engine_id=engine_id) for engine_id in Key._ENGINE_TO_ALL}
+
+# Every spelling from_musical accepts → Engine DJ ID, in one dict. Later
+# entries win, matching from_musical's historical lookup order: musical
+# notation, then OpenKey, then Camelot, then enharmonic/alternative names.
+_ANY_TO_ENGINE: dict[str, int] = {
+    **{
+        alias: Key._MUSICAL_TO_ENGINE[canonical]
+        for alias, canonical in Key._ENHARMONIC.items()
+        if canonical in Key._MUSICAL_TO_ENGINE
+    },
+    **Key._CAMELOT_TO_ENGINE,
+    **Key._OPENKEY_TO_ENGINE,
+    **Key._MUSICAL_TO_ENGINE,
+}
+
+# OpenKey notation → Engine DJ ID, for hot paths that only need the ID
+# (e.g. the library key filter) and shouldn't build a Key per lookup.
+OPENKEY_TO_ENGINE_ID: dict[str, int] = dict(Key._OPENKEY_TO_ENGINE)
@@ -4,7 +4,7 @@ import re
 from pathlib import Path
 from sqlalchemy.orm import Session
 from ..models import Track
-from ..track_metadata import FileMetadataError, read_file_metadata
+from ..track_metadata import FileMetadataError, read_file_metadata_many
 from ..track_metadata.units import bpm_to_centibpm
 from .models import (
     LibraryTrackCandidate, LibraryImportStats,
@@ -87,22 +87,22 @@ class LibraryImportManager:
         existing_tracks = self.manadj_session.query(Track.filename).all()
         existing_filenames = {str(Path(t.filename).resolve()) for t in existing_tracks}
 
-        # Find new tracks and extract metadata
-        candidates = []
+        # Find new tracks, then extract their metadata in one batch
+        new_files = []
         for file_path in audio_files:
-            file_path_str = str(file_path)
-
             # Skip if already in database
-            if file_path_str in existing_filenames:
+            if str(file_path) in existing_filenames:
                 stats.already_in_db += 1
                 continue
+            new_files.append(file_path)
+        stats.new_tracks = len(new_files)
 
-            stats.new_tracks += 1
+        candidates = []
+        for file_path, metadata in zip(new_files, read_file_metadata_many(new_files)):
+            file_path_str = str(file_path)
 
             # Extract metadata from file tags (unreadable file -> no metadata)
-            try:
-                metadata = read_file_metadata(file_path_str)
-            except FileMetadataError:
+            if isinstance(metadata, FileMetadataError):
                 metadata = None
 
             title = metadata.title if metadata else None
@@ -53,6 +53,15 @@ class ColoredFormatter(logging.Formatter):
     def __init__(self, *args, use_colors=True, **kwargs):
         super().__init__(*args, **kwargs)
         self.use_colors = use_colors
+        # levelname → "%"-template for "[time] [L] [name] " so format() does
+        # one substitution per record; standard levels are built up front,
+        # custom ones on first use.
+        self._prefixes: dict[str, str] = {}
+        for level_name in self.COLORS:
+            if level_name != "RESET":
+                self._prefix(level_name)
+        # (whole second, formatted) — records within one second share it
+        self._last_time: tuple[int, str] | None = None
 
     def apply_color(self, text: str, color: str) -> str:
         """Apply color if colors are enabled, otherwise return plain text."""
@@ -61,24 +70,39 @@ class ColoredFormatter(logging.Formatter):
             return f"{color_code}{text}{ANSICOLORS.RESET}"
         return text
 
-    def format(self, record):
-        # Format timestamp
-        timestamp = self.formatTime(record, self.datefmt)
-        grey_timestamp = self.apply_color(f"[{timestamp}]", "GREY")
-
-        # Format colored level
-        level_name = record.levelname
-        colored_level = self.apply_color(level_name[0], level_name)
+    def _prefix(self, level_name: str) -> str:
+        prefix = self._prefixes.get(level_name)
+        if prefix is None:
+            # Escape "%" so a custom level name can't break the template
+            level_letter = level_name[0].replace("%", "%%")
+            prefix = " ".join([
+                self.apply_color("[%s]", "GREY"),
+                f"[{self.apply_color(level_letter, level_name)}]",
+                self.apply_color("[%s]", level_name),
+                "",
+            ])
+            self._prefixes[level_name] = prefix
+        return prefix
+
+    def _timestamp(self, record) -> str:
+        if not self.datefmt:
+            return self.formatTime(record)  # default format carries msecs
+        second = int(record.created)
+        cached = self._last_time  # one read: handlers may format concurrently
+        if cached is None or cached[0] != second:
+            cached = (second, self.formatTime(record, self.datefmt))
+            self._last_time = cached
+        return cached[1]
 
-        # Build base log message
-        logger_name = self.apply_color(f"[{record.name}]", level_name)
-        parts = [grey_timestamp, f"[{colored_level}]", logger_name]
-
-        # Add the actual message
-        parts.append(record.getMessage())
+    def format(self, record):
+        # Timestamp and logger name drop into the level's cached template
+        timestamp = self._timestamp(record)
+        log_message = (
+            self._prefix(record.levelname) % (timestamp, record.name)
+            + record.getMessage()
+        )
 
         # Handle exceptions
-        log_message = " ".join(parts)
         if record.exc_info and (not record.exc_text or isinstance(record.exc_text, bool)):
             record.exc_text = self.formatException(record.exc_info)
         if record.exc_text and isinstance(record.exc_text, str):
@@ -1,7 +1,10 @@
 """Main FastAPI application."""
 
+import fcntl
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import IO
 
 from alembic import command as alembic_command
 from alembic.config import Config as AlembicConfig
@@ -26,15 +29,40 @@ _repo_root = Path(__file__).parent.parent
 _sys.path.insert(0, str(_repo_root / "scripts" / "agent"))
 import db_backup as _db_backup  # noqa: E402
 
-if (_repo_root / "data" / "library.db").resolve() == _db_backup.REAL_DB.resolve():
-    _db_backup.maybe_backup()
 
-# Migrate the database to the latest revision (replaces Base.metadata.create_all)
-_alembic_cfg = AlembicConfig(str(Path(__file__).parent.parent / "alembic.ini"))
-_alembic_cfg.attributes["configure_logger"] = False  # don't clobber app logging
-alembic_command.upgrade(_alembic_cfg, "head")
+def _prepare_database() -> None:
+    """Back up, then migrate the database to the latest revision (replaces
+    Base.metadata.create_all). Runs at startup, not import, and skips the
+    alembic command run entirely when the DB is already at head."""
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
 
-app = FastAPI(title="Music Library Manager", version="1.0.0")
+    from .database import engine
+
+    if (_repo_root / "data" / "library.db").resolve() == _db_backup.REAL_DB.resolve():
+        _db_backup.maybe_backup()
+
+    alembic_cfg = AlembicConfig(str(_repo_root / "alembic.ini"))
+    alembic_cfg.attributes["configure_logger"] = False  # don't clobber app logging
+    if not os.environ.get("MANADJ_DB_URL"):  # else alembic targets another DB
+        heads = set(ScriptDirectory.from_config(alembic_cfg).get_heads())
+        with engine.connect() as conn:
+            if set(MigrationContext.configure(conn).get_current_heads()) == heads:
+                return
+    alembic_command.upgrade(alembic_cfg, "head")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Migrate the database and start background workers; stop them on exit."""
+    _startup()
+    try:
+        yield
+    finally:
+        _shutdown()
+
+
+app = FastAPI(title="Music Library Manager", version="1.0.0", lifespan=lifespan)
 
 # CORS for frontend
 app.add_middleware(
@@ -142,50 +170,83 @@ def _build_task_worker() -> "TaskWorker | None":
 
 
 _task_worker: "TaskWorker | None" = None
+_worker_lock: IO[str] | None = None  # open lock file, held for process life
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Start background workers on server startup."""
+def _acquire_worker_lock() -> bool:
+    """Elect this process as the one that runs background tasks for its DB.
+
+    Under `uvicorn --workers N` every process runs the lifespan; without the
+    election each would start a TaskWorker and sweep the same Tracks. A
+    non-blocking flock next to the DB file: the first process wins, the
+    others serve requests only. The OS drops the lock if the holder dies.
+    """
+    global _worker_lock
+    from .database import DB_PATH
+
+    lock_file = open(DB_PATH.with_name(DB_PATH.name + ".worker.lock"), "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return False
+    _worker_lock = lock_file
+    return True
+
+
+def _startup() -> None:
     global _task_worker
 
+    _prepare_database()
+
     # Waveform data generation (ADR 0014) requires ffmpeg; fail loudly at startup.
     from .waveform_data import ensure_ffmpeg
     ensure_ffmpeg()
-    if os.getenv("DISABLE_TASK_WORKER", "").lower() not in ("true", "1", "yes"):
-        _task_worker = _build_task_worker()
-        if _task_worker is not None:
-            _task_worker.start()
-
-        # Sweep: any Track still lacking Waveform data gets a task.
-        if _waveform_generation_enabled():
-            from .database import SessionLocal
-            from .waveform_tasks import enqueue_missing_waveforms
-
-            db = SessionLocal()
-            try:
-                enqueue_missing_waveforms(db)
-            finally:
-                db.close()
-
-        # Sweep: any Track still missing native Analysis gets a task
-        # (ADR 0024; bails have diagnostics and are done, not missing).
-        if _analysis_enabled():
-            from .analysis_tasks import enqueue_missing_analysis
-            from .database import SessionLocal
-
-            db = SessionLocal()
-            try:
-                enqueue_missing_analysis(db)
-            finally:
-                db.close()
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Stop background workers on server shutdown."""
+    if os.getenv("DISABLE_TASK_WORKER", "").lower() in ("true", "1", "yes"):
+        return
+    if not _acquire_worker_lock():
+        import logging
+
+        logging.getLogger("backend.main").info(
+            "task worker not started: another process holds the worker lock"
+        )
+        return
+
+    _task_worker = _build_task_worker()
+    if _task_worker is not None:
+        _task_worker.start()
+
+    # Sweep: any Track still lacking Waveform data gets a task.
+    if _waveform_generation_enabled():
+        from .database import SessionLocal
+        from .waveform_tasks import enqueue_missing_waveforms
+
+        db = SessionLocal()
+        try:
+            enqueue_missing_waveforms(db)
+        finally:
+            db.close()
+
+    # Sweep: any Track still missing native Analysis gets a task
+    # (ADR 0024; bails have diagnostics and are done, not missing).
+    if _analysis_enabled():
+        from .analysis_tasks import enqueue_missing_analysis
+        from .database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            enqueue_missing_analysis(db)
+        finally:
+            db.close()
+
+
+def _shutdown() -> None:
+    global _worker_lock
     if _task_worker is not None:
         _task_worker.stop()
+    if _worker_lock is not None:
+        _worker_lock.close()  # releases the flock
+        _worker_lock = None
 
 
 @app.get("/")
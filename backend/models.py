@@ -1,8 +1,10 @@
 """SQLAlchemy models for music library database."""
 
+import hashlib
 import json
 
-from sqlalchemy import Boolean, CheckConstraint, Column, Integer, LargeBinary, String, Text, Float, ForeignKey, DateTime, Index, and_, select
+from sqlalchemy import Boolean, CheckConstraint, Column, Integer, LargeBinary, String, Text, Float, ForeignKey, DateTime, Index, and_, event, select
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import backref, deferred, relationship, DeclarativeBase
 from sqlalchemy.sql import func
@@ -17,7 +19,7 @@ class Track(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     filename = Column(String, unique=True, nullable=False, index=True)
-    file_hash = Column(String, index=True)
+    file_hash = Column(String)
     energy = Column(Integer)  # 1-5 energy level
     title = Column(String, nullable=True)
     artist = Column(String, nullable=True)
@@ -57,6 +59,14 @@ class Track(Base):
 
     # Relationships
     track_tags = relationship("TrackTag", back_populates="track", cascade="all, delete-orphan")
+    # One-to-one satellites (track_id is unique on each). Lazy "select" by
+    # default: list queries that read them opt into joinedload explicitly.
+    waveform = relationship("Waveform", back_populates="track", uselist=False)
+    beatgrid = relationship("Beatgrid", back_populates="track", uselist=False)
+    grid_analysis = relationship("GridAnalysis", back_populates="track", uselist=False)
+    # The Track's Tags (schemas.Track.tags), read through track_tags on
+    # access — only serialized responses pay for building the list.
+    tags = association_proxy("track_tags", "tag")
 
     @hybrid_property
     def needs_attention(self) -> bool:
@@ -111,6 +121,15 @@ class Track(Base):
                 return dominant_bpm(tempo_changes, duration)
         return centibpm_to_bpm(self.bpm)
 
+    __table_args__ = (
+        # Library-view filters (crud.get_tracks): energy range, often with a
+        # BPM window, and the key ANY-match.
+        Index("idx_tracks_energy_bpm", "energy", "bpm"),
+        # BPM window without an energy filter, and the BPM column sort.
+        Index("idx_tracks_bpm_energy", "bpm", "energy"),
+        Index("idx_tracks_key", "key"),
+    )
+
 
 class Waveform(Base):
     """Waveform data (ADR 0014): one style-agnostic analysis blob per Track."""
@@ -125,11 +144,26 @@ class Waveform(Base):
     # Waveform data v2 blob (ADR 0014). Deferred: multi-hundred-KB per row —
     # never load it via relationship traversal (see the 21s sync-status incident).
     data_blob = deferred(Column(LargeBinary, nullable=True))
+    # Content digest of data_blob (waveform_blob_digest), kept in step by
+    # the set listener below: the blob's ETag, answerable without the blob.
+    data_digest = Column(String, nullable=True)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
     # Relationship (one-to-one: track_id is unique)
-    track = relationship("Track", backref=backref("waveform", uselist=False))
+    track = relationship("Track", back_populates="waveform")
+
+
+def waveform_blob_digest(blob: bytes | None) -> str | None:
+    """Content digest of a Waveform data blob (None for no blob)."""
+    return hashlib.blake2b(blob, digest_size=16).hexdigest() if blob is not None else None
+
+
+@event.listens_for(Waveform.data_blob, "set")
+def _waveform_blob_set(target, value, oldvalue, initiator):
+    # ORM writes (constructor, assignment) refresh the digest; bulk
+    # query.update() bypasses this and must pass data_digest itself.
+    target.data_digest = waveform_blob_digest(value)
 
 
 class TagCategory(Base):
@@ -175,9 +209,12 @@ class TrackTag(Base):
     tag = relationship("Tag", back_populates="track_tags")
 
     __table_args__ = (
-        Index("idx_track_tags_track", "track_id"),
-        Index("idx_track_tags_tag", "tag_id"),
+        # Track-first and tag-first composites; each also serves lookups on
+        # its leading column, so there are no single-column indexes here.
         Index("idx_track_tags_unique", "track_id", "tag_id", unique=True),
+        # Tag-first covering index: the tag filter resolves to track ids
+        # without touching the table.
+        Index("idx_track_tags_tag_track", "tag_id", "track_id"),
     )
 
 
@@ -209,8 +246,8 @@ class PlaylistTrack(Base):
     track = relationship("Track")
 
     __table_args__ = (
-        Index("idx_playlist_tracks_playlist", "playlist_id"),
         Index("idx_playlist_tracks_track", "track_id"),
+        # Also serves playlist_id-only lookups.
         Index("idx_playlist_tracks_position", "playlist_id", "position"),
         # A Track appears at most once per Playlist (entry identity).
         Index("uq_playlist_tracks_playlist_track", "playlist_id", "track_id", unique=True),
@@ -235,7 +272,7 @@ class Beatgrid(Base):
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
     # Relationship (one-to-one: track_id is unique)
-    track = relationship("Track", backref=backref("beatgrid", uselist=False))
+    track = relationship("Track", back_populates="beatgrid")
 
 
 class GridAnalysis(Base):
@@ -259,7 +296,7 @@ class GridAnalysis(Base):
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
     # Relationship (one-to-one: track_id is unique)
-    track = relationship("Track", backref=backref("grid_analysis", uselist=False))
+    track = relationship("Track", back_populates="grid_analysis")
 
 
 class Transition(Base):
@@ -513,7 +550,7 @@ class SetEntry(Base):
     track = relationship("Track")
 
     __table_args__ = (
-        Index("idx_set_entries_set", "set_id"),
+        # Also serves set_id-only lookups.
         Index("idx_set_entries_position", "set_id", "position"),
         # A Track appears at most once per Set (entry identity).
         Index("uq_set_entries_set_track", "set_id", "track_id", unique=True),
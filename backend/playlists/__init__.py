@@ -3,6 +3,7 @@
 from .models import (
     TrackReference,
     PlaylistInfo,
+    MatchedTriple,
     UnifiedPlaylist,
     PlaylistDiff,
     PlaylistSyncStats,
@@ -14,6 +15,7 @@ from .sync_manager import PlaylistSyncManager
 __all__ = [
     'TrackReference',
     'PlaylistInfo',
+    'MatchedTriple',
     'UnifiedPlaylist',
     'PlaylistDiff',
     'PlaylistSyncStats',
@@ -1,6 +1,6 @@
 """Playlist comparison logic."""
 
-from .models import PlaylistInfo, PlaylistDiff
+from .models import PlaylistInfo, PlaylistDiff, TrackReference
 from backend.sync_common.matching import TrackIndex
 
 
@@ -22,10 +22,28 @@ def are_playlists_equivalent(
     if len(playlist_a.tracks) != len(playlist_b.tracks):
         return False
 
-    index_b = TrackIndex.build(playlist_b.tracks, lambda t: t.path)
-
-    # Check if each track in playlist_a matches playlist_b in order
-    for track_a, track_b in zip(playlist_a.tracks, playlist_b.tracks):
+    # Walk the shared prefix of identical paths (the usual synced case)
+    # without an index; from the first mismatch on, two-tier matching over
+    # the rest of playlist_b only.
+    tracks_a, tracks_b = playlist_a.tracks, playlist_b.tracks
+    start = 0
+    for track_a, track_b in zip(tracks_a, tracks_b):
+        if not track_a.path or track_a.path != track_b.path:
+            break
+        start += 1
+    else:
+        return True
+
+    index_b = TrackIndex.build(tracks_b[start:], lambda t: t.path)
+    # Over the whole of playlist_b, a path found only in the prefix matches
+    # that prefix track (exact tier), never a suffix position; the suffix
+    # index alone would let it fall through to the basename tier.
+    prefix_paths = {track.path for track in tracks_b[:start]}
+
+    # Check if each remaining track in playlist_a matches playlist_b in order
+    for track_a, track_b in zip(tracks_a[start:], tracks_b[start:]):
+        if track_a.path in prefix_paths and track_a.path not in index_b.by_path:
+            return False
         matched = index_b.match(track_a.path)
 
         # Must match the same position track in playlist_b
@@ -51,25 +69,24 @@ def compare_playlists(
     Returns:
         PlaylistDiff describing differences between playlists
     """
-    # Convert to sets for efficient comparison
-    paths_a = {track.path for track in playlist_a.tracks}
-    paths_b = {track.path for track in playlist_b.tracks}
-
-    # Find added and removed tracks
-    added_paths = paths_b - paths_a
-    removed_paths = paths_a - paths_b
-
-    # Get full track objects for added/removed
-    added_tracks = [t for t in playlist_b.tracks if t.path in added_paths]
-    removed_tracks = [t for t in playlist_a.tracks if t.path in removed_paths]
-
-    # Check for reordering: same tracks, different order
-    reordered = False
-    if paths_a == paths_b:  # Same tracks
-        # Check if order is different
-        order_a = [t.path for t in playlist_a.tracks]
-        order_b = [t.path for t in playlist_b.tracks]
-        reordered = order_a != order_b
+    # Path sets are cached on the PlaylistInfo across comparisons
+    paths_a = playlist_a.paths_set
+    paths_b = playlist_b.paths_set
+
+    if paths_a == paths_b:
+        # Same tracks: nothing added or removed, so skip both membership
+        # passes; only the order can differ (lockstep walk, stops at the
+        # first difference).
+        added_tracks: list[TrackReference] = []
+        removed_tracks: list[TrackReference] = []
+        reordered = len(playlist_a.tracks) != len(playlist_b.tracks) or any(
+            a.path != b.path for a, b in zip(playlist_a.tracks, playlist_b.tracks)
+        )
+    else:
+        # Added/removed: one pass per list against the other side's set
+        added_tracks = [t for t in playlist_b.tracks if t.path not in paths_a]
+        removed_tracks = [t for t in playlist_a.tracks if t.path not in paths_b]
+        reordered = False
 
     return PlaylistDiff(
         added_tracks=added_tracks,
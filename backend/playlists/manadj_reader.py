@@ -1,9 +1,13 @@
 """manadj playlist reader."""
 
+import sys
+from itertools import groupby
+from operator import itemgetter
+
 from sqlalchemy.orm import Session
-from pathlib import Path
 
 from backend.models import Playlist, PlaylistTrack, Track
+from backend.sync_common.matching import basename
 from .models import PlaylistInfo, TrackReference
 
 
@@ -27,19 +31,45 @@ class ManAdjPlaylistReader:
         Returns:
             List of PlaylistInfo objects ordered by display_order
         """
-        playlists = self.session.query(Playlist).order_by(Playlist.display_order).all()
+        # One query for every playlist and its entries (outer joins keep
+        # empty playlists), grouped here — not one track query per playlist.
+        # Streamed in batches, so the full row list never coexists with the
+        # TrackReferences built from it. Plain columns only: no ORM entity
+        # (identity map, instance state) is built for any row.
+        rows = (
+            self.session.query(
+                Playlist.id,
+                Playlist.name,
+                Playlist.updated_at,
+                Playlist.color,
+                PlaylistTrack.track_id,
+                Track.filename,
+                Track.title,
+                Track.artist,
+            )
+            .outerjoin(PlaylistTrack, PlaylistTrack.playlist_id == Playlist.id)
+            .outerjoin(Track, Track.id == PlaylistTrack.track_id)
+            .order_by(Playlist.display_order, Playlist.id, PlaylistTrack.position)
+            .yield_per(1000)
+        )
 
         result = []
-        for playlist in playlists:
-            tracks = self.get_playlist_tracks(playlist.id)
+        for (playlist_id, name, updated_at, color), group in groupby(
+            rows, key=itemgetter(0, 1, 2, 3)
+        ):
+            tracks = [
+                _track_reference(track_id, filename, title, artist)
+                for *_, track_id, filename, title, artist in group
+                if filename is not None  # empty playlist, or Track deleted
+            ]
             result.append(PlaylistInfo(
-                name=playlist.name,
+                name=name,
                 tracks=tracks,
                 source='manadj',
-                source_id=playlist.id,
+                source_id=playlist_id,
                 hierarchy_parts=None,  # manadj is flat
-                last_modified=playlist.updated_at,
-                color=playlist.color
+                last_modified=updated_at,
+                color=color
             ))
 
         return result
@@ -53,23 +83,31 @@ class ManAdjPlaylistReader:
         Returns:
             List of TrackReference objects ordered by position
         """
-        playlist_tracks = (
-            self.session.query(PlaylistTrack)
-            .filter_by(playlist_id=playlist_id)
+        # One join instead of a Track lookup per entry; the inner join also
+        # drops entries whose Track no longer exists.
+        rows = (
+            self.session.query(
+                PlaylistTrack.track_id, Track.filename, Track.title, Track.artist
+            )
+            .join(Track, Track.id == PlaylistTrack.track_id)
+            .filter(PlaylistTrack.playlist_id == playlist_id)
             .order_by(PlaylistTrack.position)
             .all()
         )
 
-        result = []
-        for pt in playlist_tracks:
-            track = self.session.query(Track).filter_by(id=pt.track_id).first()
-            if track:
-                result.append(TrackReference(
-                    path=track.filename,  # Already absolute path
-                    filename=Path(track.filename).name,
-                    title=track.title,
-                    artist=track.artist,
-                    track_id=pt.track_id
-                ))
-
-        return result
+        return [_track_reference(*row) for row in rows]
+
+
+def _track_reference(
+    track_id: int, filename: str, title: str | None, artist: str | None
+) -> TrackReference:
+    # Interned: a Track in many playlists comes back as a fresh string per
+    # row; one shared object saves memory and makes set/dict probes hit on
+    # identity before comparing characters.
+    return TrackReference(
+        path=sys.intern(filename),  # Already absolute path
+        filename=sys.intern(basename(filename)),
+        title=title,
+        artist=artist,
+        track_id=track_id
+    )
@@ -1,11 +1,13 @@
 """Playlist name matching logic."""
 
-from .models import PlaylistInfo
+from .models import MatchedTriple, PlaylistInfo
+
+SOURCES = MatchedTriple._fields  # ('manadj', 'engine', 'rekordbox')
 
 
 def match_playlists_by_name(
     all_playlists: dict[str, list[PlaylistInfo]]
-) -> dict[str, dict[str, PlaylistInfo | None]]:
+) -> dict[str, MatchedTriple]:
     """Match playlists by name across all sources.
 
     Case-sensitive matching as per user requirements. Handles playlists
@@ -16,34 +18,24 @@ def match_playlists_by_name(
                       and values as lists of PlaylistInfo objects
 
     Returns:
-        Dictionary mapping playlist name to dict of sources:
+        Dictionary mapping playlist name to its MatchedTriple:
         {
-            "Playlist Name": {
-                'manadj': PlaylistInfo or None,
-                'engine': PlaylistInfo or None,
-                'rekordbox': PlaylistInfo or None
-            },
+            "Playlist Name": MatchedTriple(
+                manadj=PlaylistInfo or None,
+                engine=PlaylistInfo or None,
+                rekordbox=PlaylistInfo or None,
+            ),
             ...
         }
     """
-    # Collect all unique playlist names across all sources
-    all_names = set()
-    for playlists in all_playlists.values():
-        for playlist in playlists:
-            all_names.add(playlist.name)
-
-    # Build lookup dictionaries for each source
-    manadj_by_name = {p.name: p for p in all_playlists.get('manadj', [])}
-    engine_by_name = {p.name: p for p in all_playlists.get('engine', [])}
-    rekordbox_by_name = {p.name: p for p in all_playlists.get('rekordbox', [])}
-
-    # Match playlists by name
-    matched = {}
-    for name in all_names:
-        matched[name] = {
-            'manadj': manadj_by_name.get(name),
-            'engine': engine_by_name.get(name),
-            'rekordbox': rekordbox_by_name.get(name),
-        }
-
-    return matched
+    # One pass: each playlist lands in its name's slot as it is seen (last
+    # wins on duplicate names within a source, as before)
+    slots: dict[str, list[PlaylistInfo | None]] = {}
+    for i, source in enumerate(SOURCES):
+        for playlist in all_playlists.get(source, []):
+            row = slots.get(playlist.name)
+            if row is None:
+                row = slots[playlist.name] = [None, None, None]
+            row[i] = playlist
+
+    return {name: MatchedTriple(*row) for name, row in slots.items()}
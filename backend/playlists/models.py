@@ -1,11 +1,13 @@
 """Data models for playlist synchronization."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, NamedTuple
 
+from backend.sync_common.matching import basename
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TrackReference:
     """Lightweight track reference for playlist contents.
 
@@ -19,7 +21,7 @@ class TrackReference:
     track_id: int | str | None = None # Source-specific track ID (int for manadj/Engine, str for Rekordbox)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistInfo:
     """Generic playlist representation across all sources.
 
@@ -33,9 +35,36 @@ class PlaylistInfo:
     hierarchy_parts: list[str] | None  # Original hierarchy for potential recreation
     last_modified: datetime | None     # When available
     color: str | None = None           # manadj only
-
-
-@dataclass
+    _paths: frozenset[str] | None = field(default=None, init=False, repr=False, compare=False)
+    _basenames: tuple[str | None, ...] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def paths_set(self) -> frozenset[str]:
+        """Set of track paths, built on first use and reused across
+        comparisons (tracks are not mutated after read)."""
+        if self._paths is None:
+            self._paths = frozenset(track.path for track in self.tracks)
+        return self._paths
+
+    @property
+    def basename_key(self) -> tuple[str | None, ...]:
+        """Ordered basenames (None for a pathless track), the key Match's
+        filename tier sees; built on first use like paths_set."""
+        if self._basenames is None:
+            self._basenames = tuple(
+                basename(track.path) if track.path else None for track in self.tracks
+            )
+        return self._basenames
+
+
+class MatchedTriple(NamedTuple):
+    """One playlist name's counterpart in each source (None where absent)."""
+    manadj: PlaylistInfo | None
+    engine: PlaylistInfo | None
+    rekordbox: PlaylistInfo | None
+
+
+@dataclass(slots=True)
 class TrackEntry:
     """Track entry with filename and optional ID for metadata lookup.
 
@@ -46,7 +75,7 @@ class TrackEntry:
     track_id: int | str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedPlaylist:
     """Unified playlist view across all sources for API response.
 
@@ -60,7 +89,7 @@ class UnifiedPlaylist:
     synced: bool                          # True if all non-None sources have same tracks
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistDiff:
     """Difference between two playlists.
 
@@ -73,7 +102,7 @@ class PlaylistDiff:
     tracks_count_b: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistSyncStats:
     """Statistics for playlist sync operations.
 
@@ -94,7 +123,7 @@ class PlaylistSyncStats:
     conflicts_detected: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResult:
     """Result of syncing a playlist to one target.
 
@@ -1,12 +1,47 @@
 """Playlist sync manager - orchestration class."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+from sqlalchemy import delete, insert, literal_column
 from sqlalchemy.orm import Session
 
-from .models import PlaylistInfo, UnifiedPlaylist, PlaylistSyncStats, TrackEntry, SyncResult, TrackReference
+from backend.models import Playlist, PlaylistTrack, Track
+from enginedj.models.information import Information
+from enginedj.models.track import Track as EDJTrack
+from enginedj.playlist import (
+    create_or_update_playlist as edj_create_or_update_playlist,
+    find_playlist_by_title_and_parent,
+)
+from enginedj.playlist_reader import EnginePlaylistReader
+from .models import MatchedTriple, PlaylistInfo, UnifiedPlaylist, PlaylistSyncStats, TrackEntry, SyncResult, TrackReference
 from .comparison import are_playlists_equivalent
-from .matching import match_playlists_by_name
+from .matching import SOURCES, match_playlists_by_name
 from .manadj_reader import ManAdjPlaylistReader
-from backend.sync_common.matching import TrackIndex
+from backend.sync_common.matching import TrackIndex, basename
+
+
+# Table-scan order. The full-table loads this replaces (query(...).all(),
+# get_content()) fed TrackIndex.build in rowid order, so "last row wins"
+# means last by rowid; ordering by id would differ for Rekordbox, whose
+# DjmdContent.ID is text and sorts lexicographically.
+_ROWID = literal_column("rowid")
+
+
+def _basename_ids(session: Session, id_col, path_col) -> dict:
+    """Basename -> id of the target row the basename tier resolves it to.
+
+    Last row in rowid order wins, as in TrackIndex.build over a table scan;
+    only the (id, path) columns are read.
+    """
+    ids_by_name = {}
+    # Ordered: a bare (id, path) select may be served from the path index,
+    # which would change which duplicate basename wins.
+    for track_id, path in session.query(id_col, path_col).order_by(_ROWID):
+        if path:
+            ids_by_name[basename(path)] = track_id
+    return ids_by_name
 
 
 class PlaylistSyncManager:
@@ -34,15 +69,31 @@ class PlaylistSyncManager:
         # Conditionally create Engine DJ reader
         self.engine_reader = None
         if engine_db:
-            from enginedj.playlist_reader import EnginePlaylistReader
             self.engine_reader = EnginePlaylistReader(engine_db)
 
-        # Conditionally create Rekordbox reader
+        # Conditionally create Rekordbox reader (pyrekordbox is imported
+        # only once a Rekordbox database is in play; see the sync routers)
         self.rb_reader = None
         if rb_db:
             from rekordbox.playlist_reader import RekordboxPlaylistReader
             self.rb_reader = RekordboxPlaylistReader(rb_db)
 
+        # Per-source playlist snapshots, read at most once per manager (one
+        # request) and dropped when that source is written to.
+        self._playlists: dict[str, list[PlaylistInfo]] = {}
+        self._playlists_by_name: dict[str, dict[str, PlaylistInfo]] = {}
+        self._matched: dict[str, MatchedTriple] | None = None
+
+        # Per-target basename -> id maps (see _basename_ids), scanned at most
+        # once per manager. Playlist writes never add or remove target
+        # tracks, so unlike the snapshots these survive a sync.
+        self._basename_ids: dict[str, dict] = {}
+
+        # sync_playlist_to_all runs targets on worker threads; each Engine
+        # and Rekordbox target has its own connection, but the manadj
+        # session is not thread-safe, so its users serialize on this.
+        self._manadj_lock = threading.Lock()
+
     def load_all_playlists(self) -> dict[str, list[PlaylistInfo]]:
         """Load playlists from all available sources.
 
@@ -50,20 +101,42 @@ class PlaylistSyncManager:
             Dictionary with keys 'manadj', 'engine', 'rekordbox' and
             lists of PlaylistInfo as values
         """
-        result = {'manadj': [], 'engine': [], 'rekordbox': []}
-
-        # Always load manadj
-        result['manadj'] = self.manadj_reader.get_all_playlists()
-
-        # Load Engine DJ if available
-        if self.engine_reader:
-            result['engine'] = self.engine_reader.get_all_playlists()
-
-        # Load Rekordbox if available
-        if self.rb_reader:
-            result['rekordbox'] = self.rb_reader.get_all_playlists()
-
-        return result
+        return {source: self._load_playlists(source) for source in SOURCES}
+
+    def _load_playlists(self, source: str) -> list[PlaylistInfo]:
+        """One source's playlists ([] when not configured), cached until
+        that source is written to."""
+        cached = self._playlists.get(source)
+        if cached is not None:
+            return cached
+
+        reader = {
+            'manadj': self.manadj_reader,
+            'engine': self.engine_reader,
+            'rekordbox': self.rb_reader,
+        }[source]
+        with self._manadj_lock if source == 'manadj' else nullcontext():
+            playlists = reader.get_all_playlists() if reader else []
+        self._playlists[source] = playlists
+        return playlists
+
+    def _compute_matched(self) -> dict[str, MatchedTriple]:
+        """Name-matched playlists over the current snapshots, computed once
+        and reset whenever a snapshot is dropped."""
+        if self._matched is None:
+            self._matched = match_playlists_by_name(self.load_all_playlists())
+        return self._matched
+
+    def _playlists_named(self, source: str) -> dict[str, PlaylistInfo]:
+        """One source's playlists by name (first wins on duplicate names),
+        built alongside and dropped with that source's snapshot."""
+        by_name = self._playlists_by_name.get(source)
+        if by_name is None:
+            by_name = {}
+            for playlist in self._load_playlists(source):
+                by_name.setdefault(playlist.name, playlist)
+            self._playlists_by_name[source] = by_name
+        return by_name
 
     def get_unified_view(self) -> list[UnifiedPlaylist]:
         """Get unified view of all playlists for API response.
@@ -71,35 +144,32 @@ class PlaylistSyncManager:
         Returns:
             List of UnifiedPlaylist objects for UI display
         """
-        # Load all playlists
-        all_playlists = self.load_all_playlists()
-
         # Match by name
-        matched = match_playlists_by_name(all_playlists)
+        matched = self._compute_matched()
 
         # Convert to UnifiedPlaylist objects
         result = []
         for name, sources in matched.items():
             # Extract filenames AND track IDs from each source
             manadj_tracks = None
-            if sources['manadj']:
+            if sources.manadj:
                 manadj_tracks = [
                     TrackEntry(filename=t.filename, track_id=t.track_id)
-                    for t in sources['manadj'].tracks
+                    for t in sources.manadj.tracks
                 ]
 
             engine_tracks = None
-            if sources['engine']:
+            if sources.engine:
                 engine_tracks = [
                     TrackEntry(filename=t.filename, track_id=t.track_id)
-                    for t in sources['engine'].tracks
+                    for t in sources.engine.tracks
                 ]
 
             rekordbox_tracks = None
-            if sources['rekordbox']:
+            if sources.rekordbox:
                 rekordbox_tracks = [
                     TrackEntry(filename=t.filename, track_id=t.track_id)
-                    for t in sources['rekordbox'].tracks
+                    for t in sources.rekordbox.tracks
                 ]
 
             # Check if synced
@@ -116,28 +186,35 @@ class PlaylistSyncManager:
 
         return result
 
-    def _check_if_synced(self, sources: dict[str, PlaylistInfo | None]) -> bool:
+    def _check_if_synced(self, sources: MatchedTriple) -> bool:
         """Check if all non-None sources have identical tracks.
 
         Args:
-            sources: Dictionary with 'manadj', 'engine', 'rekordbox' keys
+            sources: The name's MatchedTriple (manadj, engine, rekordbox)
 
         Returns:
             True if all non-None playlists have the same tracks in same order
         """
         # Get non-None playlists
-        playlists = [p for p in sources.values() if p is not None]
+        playlists = [p for p in sources if p is not None]
 
         if len(playlists) <= 1:
             return True  # Nothing to compare or only one source
 
-        # Compare all playlists against the first one
+        # One basename key per playlist, compared directly. Two-tier Match
+        # can only pair tracks with equal basenames and never pairs a
+        # pathless one, so differing keys (or a None) settle it; equal keys
+        # with no repeated basename leave each track exactly one candidate,
+        # which is then its counterpart.
         base = playlists[0]
-        for playlist in playlists[1:]:
-            if not are_playlists_equivalent(base, playlist):
-                return False
+        key = base.basename_key
+        if None in key or any(p.basename_key != key for p in playlists[1:]):
+            return False
+        if len(set(key)) == len(key):
+            return True
 
-        return True
+        # Repeated basenames: which duplicate each path resolves to matters
+        return all(are_playlists_equivalent(base, p) for p in playlists[1:])
 
     def get_stats(self) -> PlaylistSyncStats:
         """Get loading statistics.
@@ -145,11 +222,10 @@ class PlaylistSyncManager:
         Returns:
             PlaylistSyncStats with counts of playlists per source
         """
-        # Load all playlists
+        # Load all playlists (cached) and match by name (shared with
+        # get_unified_view)
         all_playlists = self.load_all_playlists()
-
-        # Match by name
-        matched = match_playlists_by_name(all_playlists)
+        matched = self._compute_matched()
 
         # Calculate stats
         stats = PlaylistSyncStats()
@@ -160,9 +236,9 @@ class PlaylistSyncManager:
 
         # Count unique playlists per source (exists in only one source)
         for name, sources in matched.items():
-            has_manadj = sources['manadj'] is not None
-            has_engine = sources['engine'] is not None
-            has_rekordbox = sources['rekordbox'] is not None
+            has_manadj = sources.manadj is not None
+            has_engine = sources.engine is not None
+            has_rekordbox = sources.rekordbox is not None
 
             # Count playlists that exist in only one source
             if has_manadj and not has_engine and not has_rekordbox:
@@ -219,15 +295,9 @@ class PlaylistSyncManager:
                 error=f"Invalid target: {target}"
             )
 
-        # Load all playlists
-        all_playlists = self.load_all_playlists()
-
-        # Find source playlist
-        source_playlist = None
-        for playlist in all_playlists[source]:
-            if playlist.name == playlist_name:
-                source_playlist = playlist
-                break
+        # Find source playlist (only the source is read; the snapshot is
+        # reused across targets in sync_playlist_to_all)
+        source_playlist = self._playlists_named(source).get(playlist_name)
 
         if not source_playlist:
             return SyncResult(
@@ -260,6 +330,11 @@ class PlaylistSyncManager:
 
         # Sync to target (unless dry run)
         if not dry_run:
+            # The write below (even a failed, partial one) stales the
+            # target's snapshot
+            self._playlists.pop(target, None)
+            self._playlists_by_name.pop(target, None)
+            self._matched = None
             try:
                 if target == 'manadj':
                     created, was_created = self._sync_to_manadj(playlist_name, matched_tracks)
@@ -312,7 +387,6 @@ class PlaylistSyncManager:
         Returns:
             List of SyncResult, one per target
         """
-        results = []
         targets = []
 
         # Determine available targets (excluding source)
@@ -323,16 +397,26 @@ class PlaylistSyncManager:
         if source != 'rekordbox' and self.rb_db:
             targets.append('rekordbox')
 
-        # Sync to each target
-        for target in targets:
-            result = self.sync_playlist_to_target(
-                playlist_name=playlist_name,
-                source=source,
-                target=target,
-                ignore_missing_tracks=ignore_missing_tracks,
-                dry_run=dry_run
-            )
-            results.append(result)
+        def sync(target: str) -> SyncResult:
+            with self._manadj_lock if target == 'manadj' else nullcontext():
+                return self.sync_playlist_to_target(
+                    playlist_name=playlist_name,
+                    source=source,
+                    target=target,
+                    ignore_missing_tracks=ignore_missing_tracks,
+                    dry_run=dry_run
+                )
+
+        if len(targets) <= 1:
+            return [sync(target) for target in targets]
+
+        # Targets are independent databases: sync them concurrently. The
+        # source is read once up front so the workers share its snapshot.
+        if source in SOURCES:
+            self._playlists_named(source)
+        with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+            futures = [pool.submit(sync, target) for target in targets]
+            results = [future.result() for future in futures]
 
         return results
 
@@ -340,6 +424,51 @@ class PlaylistSyncManager:
     # Private Helper Methods
     # ========================================================================
 
+    def _target_index(
+        self,
+        target: str,
+        session: Session,
+        model,
+        path_attr: str,
+        id_attr: str,
+        track_refs: list[TrackReference],
+    ) -> TrackIndex:
+        """TrackIndex over just the target rows the refs can match.
+
+        Equivalent to indexing the whole target table, without loading it:
+        exact paths come from one IN query; refs left over go through the
+        target's (memoized) basename map and one IN query for the winners.
+        """
+        path_col = getattr(model, path_attr)
+        id_col = getattr(model, id_attr)
+
+        paths = {ref.path for ref in track_refs if ref.path}
+        by_path = {}
+        if paths:
+            # Rowid order: a repeated path resolves to its last row
+            for track in session.query(model).filter(path_col.in_(paths)).order_by(_ROWID):
+                by_path[getattr(track, path_attr)] = track
+
+        wanted = {basename(ref.path) for ref in track_refs if ref.path and ref.path not in by_path}
+        by_filename = {}
+        if wanted:
+            ids = self._basename_ids.get(target)
+            if ids is None:
+                ids = self._basename_ids[target] = _basename_ids(session, id_col, path_col)
+            ids_by_name = {name: ids[name] for name in wanted if name in ids}
+            if ids_by_name:
+                loaded = {
+                    getattr(track, id_attr): track
+                    for track in session.query(model).filter(id_col.in_(set(ids_by_name.values())))
+                }
+                by_filename = {
+                    name: loaded[track_id]
+                    for name, track_id in ids_by_name.items()
+                    if track_id in loaded
+                }
+
+        return TrackIndex(by_path=by_path, by_filename=by_filename)
+
     def _match_tracks_to_manadj(self, track_refs: list[TrackReference]) -> tuple[list, list[str]]:
         """Match TrackReferences to manadj Track objects.
 
@@ -349,12 +478,7 @@ class PlaylistSyncManager:
         Returns:
             Tuple of (matched_tracks, unmatched_filenames)
         """
-        from backend.models import Track
-
-        # Load all manadj tracks
-        all_tracks = self.manadj_session.query(Track).all()
-
-        index = TrackIndex.build(all_tracks, lambda t: t.filename)
+        index = self._target_index('manadj', self.manadj_session, Track, 'filename', 'id', track_refs)
 
         matched = []
         unmatched = []
@@ -380,13 +504,8 @@ class PlaylistSyncManager:
         if not self.engine_db:
             return [], [ref.filename for ref in track_refs]
 
-        from enginedj.models.track import Track as EDJTrack
-
-        # Load all Engine DJ tracks using session
         with self.engine_db.session_m() as edj_session:
-            all_tracks = edj_session.query(EDJTrack).all()
-
-            index = TrackIndex.build(all_tracks, lambda t: t.path)
+            index = self._target_index('engine', edj_session, EDJTrack, 'path', 'id', track_refs)
 
             matched = []
             unmatched = []
@@ -412,11 +531,9 @@ class PlaylistSyncManager:
         if not self.rb_db:
             return [], [ref.filename for ref in track_refs]
 
+        from pyrekordbox.db6.tables import DjmdContent
 
-        # Load all Rekordbox tracks
-        all_tracks = list(self.rb_db.get_content())
-
-        index = TrackIndex.build(all_tracks, lambda t: t.FolderPath)
+        index = self._target_index('rekordbox', self.rb_db.session, DjmdContent, 'FolderPath', 'ID', track_refs)
 
         matched = []
         unmatched = []
@@ -440,48 +557,36 @@ class PlaylistSyncManager:
         Returns:
             Tuple of (success, was_created)
         """
-        from backend.models import Playlist, PlaylistTrack
-
         # Find existing playlist by name
         existing = self.manadj_session.query(Playlist).filter(
             Playlist.name == playlist_name
         ).first()
 
         if existing:
-            # Update existing playlist
-            # Delete all existing PlaylistTrack records
-            self.manadj_session.query(PlaylistTrack).filter(
-                PlaylistTrack.playlist_id == existing.id
-            ).delete()
-
-            # Create new PlaylistTrack records
-            for i, track in enumerate(tracks):
-                pt = PlaylistTrack(
-                    playlist_id=existing.id,
-                    track_id=track.id,
-                    position=i
-                )
-                self.manadj_session.add(pt)
-
-            self.manadj_session.commit()
-            return True, False
+            # Update existing playlist: clear its PlaylistTrack records
+            playlist = existing
+            self.manadj_session.execute(
+                delete(PlaylistTrack).where(PlaylistTrack.playlist_id == playlist.id)
+            )
         else:
             # Create new playlist
             playlist = Playlist(name=playlist_name)
             self.manadj_session.add(playlist)
             self.manadj_session.flush()  # Get ID
 
-            # Create PlaylistTrack records
-            for i, track in enumerate(tracks):
-                pt = PlaylistTrack(
-                    playlist_id=playlist.id,
-                    track_id=track.id,
-                    position=i
-                )
-                self.manadj_session.add(pt)
+        # Create PlaylistTrack records in one batched INSERT rather than a
+        # unit-of-work flush per row
+        if tracks:
+            self.manadj_session.execute(
+                insert(PlaylistTrack),
+                [
+                    {"playlist_id": playlist.id, "track_id": track.id, "position": i}
+                    for i, track in enumerate(tracks)
+                ],
+            )
 
-            self.manadj_session.commit()
-            return True, True
+        self.manadj_session.commit()
+        return True, existing is None
 
     def _sync_to_engine(self, playlist_name: str, tracks: list) -> tuple[bool, bool]:
         """Write playlist to Engine DJ database.
@@ -496,22 +601,20 @@ class PlaylistSyncManager:
         if not self.engine_db:
             raise ValueError("Engine DJ database not available")
 
-        from enginedj.playlist import create_or_update_playlist
-
         # Parse hierarchy
         parent_names, leaf_name = self._parse_hierarchy(playlist_name)
 
-        # Ensure parent playlists exist
-        parent_id = self._ensure_parent_playlists_engine(parent_names)
-
-        # Create or update playlist
+        # Parents and leaf in one write session: a single commit
         with self.engine_db.session_m_write() as edj_session:
             # Get database UUID
-            from enginedj.models.information import Information
             info = edj_session.query(Information).first()
             db_uuid = info.uuid if info else None
 
-            playlist, was_created = create_or_update_playlist(
+            # Ensure parent playlists exist
+            parent_id = self._ensure_parent_playlists_engine(parent_names, edj_session, db_uuid)
+
+            # Create or update playlist
+            playlist, was_created = edj_create_or_update_playlist(
                 edj_session=edj_session,
                 title=leaf_name,
                 parent_id=parent_id,
@@ -539,17 +642,22 @@ class PlaylistSyncManager:
         # Parse hierarchy
         parent_names, leaf_name = self._parse_hierarchy(playlist_name)
 
-        # Ensure parent playlists exist
-        parent_id = self._ensure_parent_playlists_rekordbox(parent_names)
+        # Parents and leaf go out in a single commit (or not at all)
+        try:
+            # Ensure parent playlists exist
+            parent_id = self._ensure_parent_playlists_rekordbox(parent_names)
 
-        # Create or update playlist
-        playlist, was_created = create_or_update_playlist(
-            rb_db=self.rb_db,
-            name=leaf_name,
-            parent_id=parent_id,
-            rb_tracks=tracks
-        )
-        self.rb_db.commit(autoinc=True)
+            # Create or update playlist
+            playlist, was_created = create_or_update_playlist(
+                rb_db=self.rb_db,
+                name=leaf_name,
+                parent_id=parent_id,
+                rb_tracks=tracks
+            )
+            self.rb_db.commit(autoinc=True)
+        except Exception:
+            self.rb_db.rollback()
+            raise
 
         return True, was_created
 
@@ -568,11 +676,15 @@ class PlaylistSyncManager:
         else:
             return parts[:-1], parts[-1]
 
-    def _ensure_parent_playlists_engine(self, parent_names: list[str]) -> int:
+    def _ensure_parent_playlists_engine(self, parent_names: list[str], edj_session, db_uuid) -> int:
         """Ensure parent playlist hierarchy exists in Engine DJ.
 
+        Runs in the caller's write session; the caller commits.
+
         Args:
             parent_names: List of parent names in order (e.g., ['Parent', 'Child'])
+            edj_session: Writable Engine DJ session
+            db_uuid: Engine database UUID (Information.uuid), if any
 
         Returns:
             Parent ID for the leaf playlist (0 if no parents)
@@ -580,41 +692,32 @@ class PlaylistSyncManager:
         if not parent_names:
             return 0
 
-        if not self.engine_db:
-            raise ValueError("Engine DJ database not available")
-
-        from enginedj.playlist import find_playlist_by_title_and_parent, create_or_update_playlist
-
         current_parent_id = 0
 
-        with self.engine_db.session_m_write() as edj_session:
-            # Get database UUID
-            from enginedj.models.information import Information
-            info = edj_session.query(Information).first()
-            db_uuid = info.uuid if info else None
-
-            for name in parent_names:
-                # Check if this level exists
-                existing = find_playlist_by_title_and_parent(edj_session, name, current_parent_id)
+        for name in parent_names:
+            # Check if this level exists
+            existing = find_playlist_by_title_and_parent(edj_session, name, current_parent_id)
 
-                if existing:
-                    current_parent_id = existing.id
-                else:
-                    # Create this level
-                    playlist, _ = create_or_update_playlist(
-                        edj_session=edj_session,
-                        title=name,
-                        parent_id=current_parent_id,
-                        edj_tracks=[],
-                        db_uuid=db_uuid
-                    )
-                    current_parent_id = playlist.id
+            if existing:
+                current_parent_id = existing.id
+            else:
+                # Create this level
+                playlist, _ = edj_create_or_update_playlist(
+                    edj_session=edj_session,
+                    title=name,
+                    parent_id=current_parent_id,
+                    edj_tracks=[],
+                    db_uuid=db_uuid
+                )
+                current_parent_id = playlist.id
 
         return current_parent_id
 
     def _ensure_parent_playlists_rekordbox(self, parent_names: list[str]) -> str:
         """Ensure parent playlist hierarchy exists in Rekordbox.
 
+        Leaves the new parents uncommitted; the caller commits.
+
         Args:
             parent_names: List of parent names in order (e.g., ['Parent', 'Child'])
 
@@ -647,6 +750,4 @@ class PlaylistSyncManager:
                 )
                 current_parent_id = playlist.ID
 
-        self.rb_db.commit(autoinc=True)
-
         return current_parent_id
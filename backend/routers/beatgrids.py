@@ -7,7 +7,7 @@ import json
 from .. import crud, schemas
 from ..database import get_db
 from ..beatgrid_utils import (
-    calculate_beats_from_tempo_changes,
+    calculate_beats_from_tempo_changes_json,
     constant_tempo_changes,
     dominant_bpm,
     re_anchor_tempo_changes,
@@ -36,19 +36,20 @@ def get_beatgrid(track_id: int, db: Session = Depends(get_db)):
     come into existence only via deliberate gestures (grid edit, import,
     re-tempo). Requires waveform to exist (for duration).
     """
-    if not crud.get_track(db, track_id):
+    bundle = crud.get_track_bundle(db, track_id)
+    if not bundle:
         raise HTTPException(status_code=404, detail="Track not found")
+    track, waveform, beatgrid = bundle
 
-    beatgrid = crud.get_beatgrid(db, track_id)
     if beatgrid:
         try:
-            return _format_beatgrid_response(beatgrid, db)
+            return _format_beatgrid_response(beatgrid, _duration(waveform))
         except ValueError as e:
             # Grid exists but its waveform is gone: a clean 4xx, not a 500.
             raise HTTPException(status_code=400, detail=str(e))
 
     try:
-        data = crud.compute_placeholder_beatgrid_data(db, track_id)
+        data = crud.placeholder_beatgrid_data(track, waveform)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     return {
@@ -62,19 +63,28 @@ def get_beatgrid(track_id: int, db: Session = Depends(get_db)):
     }
 
 
-def _format_beatgrid_response(beatgrid, db: Session):
-    """Format beatgrid model for API response."""
-    tempo_changes = json.loads(beatgrid.tempo_changes_json)
+def _duration(waveform) -> float | None:
+    """The waveform's duration, read up front: a later commit expires it."""
+    return waveform.duration if waveform else None
 
-    # Get duration from waveform
-    waveform = crud.get_waveform(db, beatgrid.track_id)
-    if not waveform:
+
+def _format_beatgrid_response(beatgrid, duration: float | None, tempo_changes: list[dict] | None = None):
+    """Format beatgrid model for API response.
+
+    duration is the track's waveform duration (None: no waveform, which is
+    an error). Callers that just wrote the grid pass its tempo_changes to
+    skip re-parsing the stored JSON.
+    """
+    if duration is None:
         raise ValueError("Waveform not found")
 
-    # Calculate beat times
-    beat_times, downbeat_times = calculate_beats_from_tempo_changes(
-        tempo_changes,
-        waveform.duration
+    if tempo_changes is None:
+        tempo_changes = json.loads(beatgrid.tempo_changes_json)
+
+    # Calculate beat times (cached on the stored tempo map)
+    beat_times, downbeat_times = calculate_beats_from_tempo_changes_json(
+        beatgrid.tempo_changes_json,
+        duration
     )
 
     return {
@@ -106,18 +116,17 @@ def set_beatgrid_downbeat(
     variable grids re-anchor by rigid shift of the tempo-change map —
     every tempo change is preserved (never flattened).
     """
-    # Get waveform for duration validation
-    waveform = crud.get_waveform(db, track_id)
+    # Track, waveform (for duration validation) and grid in one query
+    track, waveform, beatgrid = crud.get_track_bundle(db, track_id) or (None, None, None)
     if not waveform:
         raise HTTPException(status_code=400, detail="Waveform not found")
+    duration = waveform.duration
 
     # The existing grid is the tempo authority; track BPM only seeds a new grid
-    beatgrid = crud.get_beatgrid(db, track_id)
     if beatgrid:
         tempo_changes = json.loads(beatgrid.tempo_changes_json)
     else:
-        track = crud.get_track(db, track_id)
-        if not track or not track.bpm:
+        if not track.bpm:
             raise HTTPException(status_code=400, detail="Track has no BPM")
         tempo_changes = constant_tempo_changes(centibpm_to_bpm(track.bpm))
 
@@ -139,7 +148,7 @@ def set_beatgrid_downbeat(
         db, track_id, new_tempo_changes, anchor_time=request.downbeat_time
     )
 
-    return _format_beatgrid_response(beatgrid, db)
+    return _format_beatgrid_response(beatgrid, duration, new_tempo_changes)
 
 
 @router.post("/{track_id}/nudge", response_model=schemas.BeatgridResponse)
@@ -154,17 +163,18 @@ def nudge_beatgrid_endpoint(
     Positive offset shifts grid later (right), negative shifts earlier (left).
     Auto-generates beatgrid from BPM if it doesn't exist.
     """
+    # Grid and waveform (for duration) in one query
+    _, waveform, beatgrid = crud.get_track_bundle(db, track_id) or (None, None, None)
+    duration = _duration(waveform)
+
     # Get beatgrid (or create from BPM)
-    beatgrid = crud.get_beatgrid(db, track_id)
     if not beatgrid:
         try:
             beatgrid = crud.create_beatgrid_from_track_bpm(db, track_id)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
-    # Get waveform for duration
-    waveform = crud.get_waveform(db, track_id)
-    if not waveform:
+    if duration is None:
         raise HTTPException(status_code=400, detail="Waveform not found")
 
     # Parse current tempo changes
@@ -175,7 +185,7 @@ def nudge_beatgrid_endpoint(
     new_tempo_changes, applied_offset_s = nudge_func(
         tempo_changes=tempo_changes,
         offset_ms=request.offset_ms,
-        track_duration=waveform.duration
+        track_duration=duration
     )
 
     # The anchor is part of the grid: shift it by exactly the applied offset
@@ -190,7 +200,7 @@ def nudge_beatgrid_endpoint(
         db, track_id, new_tempo_changes, anchor_time=new_anchor
     )
 
-    return _format_beatgrid_response(beatgrid, db)
+    return _format_beatgrid_response(beatgrid, duration, new_tempo_changes)
 
 
 @router.delete("/{track_id}")
@@ -201,13 +211,11 @@ def delete_beatgrid(track_id: int, db: Session = Depends(get_db)):
     into the bpm column before deletion, so the served bpm is continuous
     across it. Generated rows are never an authority — no projection.
     """
-    beatgrid = crud.get_beatgrid(db, track_id)
+    track, waveform, beatgrid = crud.get_track_bundle(db, track_id) or (None, None, None)
     if beatgrid:
         if beatgrid.origin != "generated":
             tempo_changes = json.loads(beatgrid.tempo_changes_json)
-            track = crud.get_track(db, track_id)
-            if track is not None and tempo_changes:
-                waveform = crud.get_waveform(db, track_id)
+            if tempo_changes:
                 duration = waveform.duration if waveform else track.duration_secs
                 track.bpm = bpm_to_centibpm(dominant_bpm(tempo_changes, duration))
         db.delete(beatgrid)
@@ -8,7 +8,6 @@ from backend.database import get_db
 from backend.config import get_config
 from backend.playlists.sync_manager import PlaylistSyncManager
 from backend.playlists.models import UnifiedPlaylist, PlaylistSyncStats
-from rekordbox.connection import get_rekordbox_db
 
 router = APIRouter(prefix="/sync/playlists", tags=["sync"])
 
@@ -42,6 +41,7 @@ def get_unified_playlists(db: Session = Depends(get_db)):
         engine_db = EngineDJDatabase(Path(config.database.engine_dj_path))
 
     if config.database.rekordbox_path:
+        from rekordbox.connection import get_rekordbox_db
         rb_db = get_rekordbox_db()
 
     # Create sync manager - it handles reader instantiation
@@ -78,6 +78,7 @@ def get_playlist_stats(db: Session = Depends(get_db)):
         engine_db = EngineDJDatabase(Path(config.database.engine_dj_path))
 
     if config.database.rekordbox_path:
+        from rekordbox.connection import get_rekordbox_db
         rb_db = get_rekordbox_db()
 
     manager = PlaylistSyncManager(db, engine_db, rb_db)
@@ -128,6 +129,7 @@ def sync_playlist(
         engine_db = EngineDJDatabase(Path(config.database.engine_dj_path))
 
     if config.database.rekordbox_path:
+        from rekordbox.connection import get_rekordbox_db
         rb_db = get_rekordbox_db()
 
     # Create sync manager
@@ -9,7 +9,6 @@ from backend.database import get_db
 from backend.config import get_config
 from backend.tags.sync_manager import TagSyncManager
 from backend.tags.models import UnifiedTagView, TagSyncStats, TagSyncRequest
-from rekordbox.connection import get_rekordbox_db
 
 router = APIRouter(prefix="/sync/tags", tags=["sync"])
 
@@ -42,6 +41,7 @@ def get_unified_tags(db: Session = Depends(get_db)):
         engine_db = EngineDJDatabase(Path(config.database.engine_dj_path))
 
     if config.database.rekordbox_path:
+        from rekordbox.connection import get_rekordbox_db
         rb_db = get_rekordbox_db()
 
     # Create sync manager
@@ -77,6 +77,7 @@ def get_tag_stats(db: Session = Depends(get_db)):
         engine_db = EngineDJDatabase(Path(config.database.engine_dj_path))
 
     if config.database.rekordbox_path:
+        from rekordbox.connection import get_rekordbox_db
         rb_db = get_rekordbox_db()
 
     manager = TagSyncManager(db, engine_db, rb_db)
@@ -140,6 +141,7 @@ def sync_tags_to_rekordbox(
     if not config.database.rekordbox_path:
         raise HTTPException(status_code=400, detail="Rekordbox not configured")
 
+    from rekordbox.connection import get_rekordbox_db
     rb_db = get_rekordbox_db()
 
     manager = TagSyncManager(db, rb_db=rb_db)
@@ -13,8 +13,6 @@ from backend.tracks.models import (
     RekordboxTrackSyncRequest,
     RekordboxTrackSyncResult,
 )
-from backend.tracks.executor import sync_engine_via_rbxml, sync_rekordbox_tracks
-from rekordbox.connection import get_rekordbox_db
 
 router = APIRouter(prefix="/sync/tracks", tags=["sync"])
 
@@ -101,6 +99,7 @@ def sync_engine_tracks_rbxml(
 
     from enginedj.connection import EngineDJDatabase
     from pathlib import Path
+    from backend.tracks.executor import sync_engine_via_rbxml
 
     engine_db = EngineDJDatabase(Path(config.database.engine_dj_path))
 
@@ -127,6 +126,8 @@ def sync_rekordbox_tracks_bidirectional(
     if not config.database.rekordbox_path:
         raise HTTPException(status_code=404, detail="Rekordbox database not configured")
 
+    from backend.tracks.executor import sync_rekordbox_tracks
+    from rekordbox.connection import get_rekordbox_db
     rb_db = get_rekordbox_db()
 
     try:
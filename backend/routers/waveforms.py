@@ -1,6 +1,7 @@
 """API routes for waveforms (Waveform data v2 blobs, ADR 0014)."""
 
-import hashlib
+import threading
+from collections import OrderedDict
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel
@@ -11,6 +12,29 @@ from ..database import get_db
 
 router = APIRouter()
 
+# Recently served blobs keyed by content digest (the ETag). Decks reload the same handful of
+# tracks; a hit skips the blob read (hundreds of KB) entirely. Bounded to
+# a few tens of MB; the browser's immutable cache handles the rest.
+_BLOB_CACHE_SIZE = 64
+_blob_cache: OrderedDict[str, bytes] = OrderedDict()
+_blob_cache_lock = threading.Lock()
+
+
+def _cached_blob(digest: str) -> bytes | None:
+    with _blob_cache_lock:
+        blob = _blob_cache.get(digest)
+        if blob is not None:
+            _blob_cache.move_to_end(digest)
+        return blob
+
+
+def _cache_blob(digest: str, blob: bytes) -> None:
+    with _blob_cache_lock:
+        _blob_cache[digest] = blob
+        _blob_cache.move_to_end(digest)
+        while len(_blob_cache) > _BLOB_CACHE_SIZE:
+            _blob_cache.popitem(last=False)
+
 
 @router.get("/{track_id}/data")
 def get_waveform_data(track_id: int, request: Request, db: Session = Depends(get_db)):
@@ -18,13 +42,20 @@ def get_waveform_data(track_id: int, request: Request, db: Session = Depends(get
 
     404 until the background generation has produced it; clients retry.
     Waveform data never changes once generated, hence the immutable caching.
+    The ETag is the blob's content digest, stored when the blob is written
+    (Waveform.data_digest), so revalidation and cache hits answer without
+    reading the blob.
     """
-    blob = (
-        db.query(models.Waveform.data_blob)  # targeted column (deferred elsewhere)
+    row = (
+        db.query(
+            models.Waveform.id,
+            models.Waveform.data_digest,
+            models.Waveform.data_blob.isnot(None),
+        )
         .filter(models.Waveform.track_id == track_id)
-        .scalar()
+        .first()
     )
-    if blob is None:
+    if row is None or not row[2]:
         if not crud.get_track(db, track_id):
             raise HTTPException(status_code=404, detail="Track not found")
         raise HTTPException(
@@ -32,16 +63,43 @@ def get_waveform_data(track_id: int, request: Request, db: Session = Depends(get
             detail="Waveform data not ready yet, retry in a few seconds",
         )
 
-    etag = f'"{hashlib.md5(blob).hexdigest()}"'
+    waveform_id, digest, _ = row
+    blob = None
+    if digest is None:
+        # Written around the ORM without a digest: derive it from the blob
+        blob = _read_blob(db, waveform_id)
+        digest = models.waveform_blob_digest(blob)
+
+    etag = f'"{digest}"'
     headers = {
         "ETag": etag,
         "Cache-Control": "public, max-age=31536000, immutable",
     }
     if request.headers.get("if-none-match") == etag:
         return Response(status_code=304, headers=headers)
+
+    if blob is None:
+        blob = _cached_blob(digest)
+    if blob is None:
+        blob = _read_blob(db, waveform_id)
+    _cache_blob(digest, blob)
     return Response(content=blob, media_type="application/octet-stream", headers=headers)
 
 
+def _read_blob(db: Session, waveform_id: int) -> bytes:
+    blob = (
+        db.query(models.Waveform.data_blob)  # targeted column (deferred elsewhere)
+        .filter(models.Waveform.id == waveform_id)
+        .scalar()
+    )
+    if blob is None:  # cleared between the two reads
+        raise HTTPException(
+            status_code=404,
+            detail="Waveform data not ready yet, retry in a few seconds",
+        )
+    return blob
+
+
 class CuePointUpdate(BaseModel):
     cue_point_time: float | None
 
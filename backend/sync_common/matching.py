@@ -12,9 +12,19 @@ Callers provide a single ``path_of`` getter; the filename tier is derived
 from the path's basename.
 """
 
+import os.path
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from pathlib import Path
+
+
+def basename(path: str) -> str:
+    """The filename tier's key: the last path component.
+
+    A plain string split (os.path.basename) rather than building a Path per
+    row, which dominated the cost of indexing large libraries. Same result
+    as Path.name for file paths.
+    """
+    return os.path.basename(path)
 
 
 @dataclass(frozen=True)
@@ -33,7 +43,7 @@ class TrackIndex[T]:
             if not path:
                 continue
             by_path[path] = track
-            by_filename[Path(path).name] = track
+            by_filename[basename(path)] = track
         return cls(by_path=by_path, by_filename=by_filename)
 
     def match(self, path: str | None) -> T | None:
@@ -43,7 +53,7 @@ class TrackIndex[T]:
         hit = self.by_path.get(path)
         if hit is not None:
             return hit
-        return self.by_filename.get(Path(path).name)
+        return self.by_filename.get(basename(path))
 
 
 def find_unmatched[T, U](
@@ -10,7 +10,7 @@ from pathlib import Path
 
 from backend.key import Key
 from backend.library.scanner import scan_directory
-from backend.track_metadata import FileMetadataError, read_file_metadata
+from backend.track_metadata import FileMetadataError, read_file_metadata_many
 
 from .aggregator import SurfaceReader
 from .models import HotCueValue, SurfaceTrackRef, TrackFields
@@ -28,11 +28,10 @@ class DiskSurfaceReader:
 
     def list_tracks(self) -> list[SurfaceTrackRef]:
         refs = []
-        for file_path in scan_directory(Path(self._dir)):
-            try:
-                meta = read_file_metadata(file_path)
-            except FileMetadataError as e:
-                logger.warning("sync_status: unreadable file skipped: %s", e)
+        files = scan_directory(Path(self._dir))
+        for file_path, meta in zip(files, read_file_metadata_many(files)):
+            if isinstance(meta, FileMetadataError):
+                logger.warning("sync_status: unreadable file skipped: %s", meta)
                 meta = None
             refs.append(
                 SurfaceTrackRef(
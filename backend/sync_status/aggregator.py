@@ -7,13 +7,12 @@ This seam is a read-only down payment on the ExternalLibrary seam
 (architecture review candidate 3).
 """
 
-from pathlib import Path
 from typing import Mapping, Protocol
 
 from sqlalchemy.orm import Session, joinedload
 
 from backend import models
-from backend.sync_common.matching import TrackIndex
+from backend.sync_common.matching import TrackIndex, basename
 
 from .compare import (
     CUE_TIME_TOLERANCE,
@@ -296,7 +295,7 @@ def _orphan_rows(
             if id(ref) in matched_ref_ids:
                 continue
             path = ref.path or ""
-            existing = by_path.get(path) or by_filename.get(Path(path).name)
+            existing = by_path.get(path) or by_filename.get(basename(path))
             if existing is not None:
                 existing.presence[sid] = True
                 continue
@@ -317,6 +316,6 @@ def _orphan_rows(
             )
             orphans.append(row)
             by_path[path] = row
-            by_filename[Path(path).name] = row
+            by_filename[basename(path)] = row
 
     return orphans
@@ -8,6 +8,7 @@ from .file_metadata import (
     FileMetadata,
     FileMetadataError,
     read_file_metadata,
+    read_file_metadata_many,
     write_file_metadata,
 )
 from .manager import (
@@ -47,6 +48,7 @@ __all__ = [
     "centibpm_to_bpm",
     "compare_with_files",
     "read_file_metadata",
+    "read_file_metadata_many",
     "refresh_from_files",
     "sync_to_db",
     "write_file_metadata",
@@ -9,6 +9,9 @@ the silent `except: pass` in the old id3_utils hid a dead key-write for
 months).
 """
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from mutagen import File as MutagenFile  # type: ignore[attr-defined]
@@ -43,11 +46,21 @@ def read_file_metadata(path: str | Path) -> FileMetadata:
     """Read title/artist/key/bpm from an audio file.
 
     Untagged fields come back None; an unreadable or missing file raises
-    FileMetadataError.
+    FileMetadataError. Results are memoized per (path, mtime, size), so a
+    file that hasn't changed on disk is only parsed once.
     """
     path = Path(path)
-    if not path.exists():
-        raise FileMetadataError(f"file not found: {path}")
+    try:
+        st = path.stat()
+    except OSError:
+        raise FileMetadataError(f"file not found: {path}") from None
+    return _read_file_metadata_cached(path, st.st_mtime_ns, st.st_size).model_copy()
+
+
+@lru_cache(maxsize=16384)
+def _read_file_metadata_cached(path: Path, mtime_ns: int, size: int) -> FileMetadata:
+    """Parse once per file version; mtime_ns/size are only the cache key.
+    Errors are raised, and lru_cache never caches a raise."""
     try:
         if path.suffix.lower() == ".wav":
             return _read_wav(path)
@@ -58,6 +71,27 @@ def read_file_metadata(path: str | Path) -> FileMetadata:
         raise FileMetadataError(f"cannot read metadata from {path}: {e}") from e
 
 
+def _read_or_error(path: str | Path) -> FileMetadata | FileMetadataError:
+    try:
+        return read_file_metadata(path)
+    except FileMetadataError as e:
+        return e
+
+
+def read_file_metadata_many(
+    paths: Iterable[str | Path], max_workers: int = 8
+) -> list[FileMetadata | FileMetadataError]:
+    """read_file_metadata over many files (library scans), in input order.
+
+    Reads overlap on a thread pool — a tag read is mostly waiting on the
+    disk, and mutagen releases the GIL in file I/O. A file that cannot be
+    read yields its FileMetadataError in place of a result, so one bad file
+    doesn't abort the scan; callers decide how to report it.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_read_or_error, paths))
+
+
 def write_file_metadata(
     path: str | Path,
     *,
@@ -88,6 +122,10 @@ def write_file_metadata(
         raise
     except Exception as e:
         raise FileMetadataError(f"cannot write metadata to {path}: {e}") from e
+    finally:
+        # A write that lands within the filesystem's mtime granularity would
+        # otherwise serve the pre-write tags from the read cache.
+        _read_file_metadata_cached.cache_clear()
 
 
 # --- easy interface (mp3 / m4a / flac) ---
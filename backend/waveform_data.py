@@ -32,6 +32,7 @@ import shutil
 import struct
 import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import IO, Callable
 
@@ -130,13 +131,31 @@ class _WindowGroup:
 def analyze(
     filepath: str,
     on_progress: Callable[[float], None] | None = None,
+    parallel: bool = True,
 ) -> tuple[np.ndarray, np.ndarray, float]:
     """Stream-decode via ffmpeg; return (peaks_u8, bands_u8[frames, N_BANDS], duration).
 
     Constant memory for any file length. `on_progress` receives seconds of
     audio processed so far (callers with a known duration derive a percentage).
+    With `parallel`, the window groups' STFTs run on one thread each: they
+    only read the shared block buffer, and NumPy's FFT/matmul kernels
+    release the GIL. Output is identical either way.
     """
     groups = [_WindowGroup(w, idx) for w, idx in WINDOW_GROUPS]
+    pool = ThreadPoolExecutor(max_workers=len(groups)) if parallel else None
+    try:
+        return _analyze(filepath, groups, pool, on_progress)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def _analyze(
+    filepath: str,
+    groups: list[_WindowGroup],
+    pool: ThreadPoolExecutor | None,
+    on_progress: Callable[[float], None] | None,
+) -> tuple[np.ndarray, np.ndarray, float]:
     proc = subprocess.Popen(
         ["ffmpeg", "-v", "error", "-i", filepath,
          "-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "f32le", "-"],
@@ -178,8 +197,12 @@ def analyze(
 
         # Bands: each window group consumes as many aligned frames as fit.
         buf = np.concatenate([buf, x])
-        for g in groups:
-            g.consume(buf, buf_start)
+        if pool is not None:
+            for fut in [pool.submit(g.consume, buf, buf_start) for g in groups]:
+                fut.result()
+        else:
+            for g in groups:
+                g.consume(buf, buf_start)
         keep_from = max(buf_start, min(g.window_start(g.next_f) for g in groups))
         buf = buf[keep_from - buf_start:]
         buf_start = keep_from
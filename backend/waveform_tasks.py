@@ -4,9 +4,12 @@ Replaces the ad-hoc polling daemon (`waveform_worker.py`): Track creation sites
 enqueue a `waveform` task, and a startup sweep enqueues tasks for any Track
 still missing Waveform data (including pre-v2 rows whose blob column is NULL).
 
-Two generation paths, until the legacy renderer dies (issues 04/06):
-- no waveform row at all → full generation (legacy JSON/PNG + v2 blob)
-- row exists, `data_blob` NULL → v2 blob backfill only (fast path, no librosa)
+Two generation paths:
+- no waveform row at all → full generation (row + v2 blob)
+- row exists, `data_blob` NULL → v2 blob backfill only (pre-v2 rows)
+
+Either way the stored data is the binary v2 blob: uint8 peaks and bands,
+served as-is — there is no JSON peak serialization left (dropped in 0013).
 """
 
 import logging
@@ -42,23 +45,29 @@ def make_waveform_handler(full_generate: FullGenerate | None = None):
         track = crud.get_track(db, track_id)
         if track is None:
             raise LookupError(f"track {track_id} not found")
+        filename = track.filename
         waveform = crud.get_waveform(db, track_id)
+        # Test for the blob in SQL: selecting data_blob itself would pull
+        # hundreds of KB through the page cache just to compare with None.
+        has_blob = waveform is not None and bool(
+            db.query(models.Waveform.data_blob.isnot(None))
+            .filter(models.Waveform.track_id == track_id)
+            .scalar()
+        )
+        # End the read transaction before seconds of decode + DSP: analysis
+        # needs no DB, and an open read would pin the WAL (no checkpoint)
+        # for the whole run. Nothing is pending here — run_pending commits
+        # the task's state before calling us.
+        db.commit()
         if waveform is None:
             full = full_generate if full_generate is not None else crud.create_waveform
-            full(db, track_id, track.filename)
-        else:
-            has_blob = (
-                db.query(models.Waveform.data_blob)
-                .filter(models.Waveform.track_id == track_id)
-                .scalar()
-                is not None
-            )
-            if not has_blob:
-                blob = generate_blob(track.filename)
-                db.query(models.Waveform).filter(
-                    models.Waveform.track_id == track_id
-                ).update({"data_blob": blob})
-                db.commit()
+            full(db, track_id, filename)
+        elif not has_blob:
+            blob = generate_blob(filename)
+            db.query(models.Waveform).filter(
+                models.Waveform.track_id == track_id
+            ).update({"data_blob": blob, "data_digest": models.waveform_blob_digest(blob)})
+            db.commit()
 
     return handle
 
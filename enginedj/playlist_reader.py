@@ -1,12 +1,11 @@
 """Engine DJ playlist reader."""
 
-from pathlib import Path
-
 from enginedj.connection import EngineDJDatabase
 from enginedj.models.playlist import Playlist
 from enginedj.models.playlist_entity import PlaylistEntity
 from enginedj.models.track import Track
 from backend.playlists.models import PlaylistInfo, TrackReference
+from backend.sync_common.matching import basename
 
 
 class EnginePlaylistReader:
@@ -130,7 +129,7 @@ class EnginePlaylistReader:
                 if track and track.path:
                     result.append(TrackReference(
                         path=track.path,
-                        filename=Path(track.filename or track.path).name,
+                        filename=basename(track.filename or track.path),
                         title=track.title,
                         artist=track.artist,
                         track_id=entity.trackId
@@ -1,11 +1,11 @@
 """Rekordbox playlist reader."""
 
 import re
-from pathlib import Path
 
 from pyrekordbox.db6 import Rekordbox6Database
 from pyrekordbox.db6.tables import DjmdPlaylist, DjmdSongPlaylist, DjmdContent
 from backend.playlists.models import PlaylistInfo, TrackReference
+from backend.sync_common.matching import basename
 
 
 class RekordboxPlaylistReader:
@@ -92,7 +92,7 @@ class RekordboxPlaylistReader:
             if content and content.FolderPath:
                 result.append(TrackReference(
                     path=content.FolderPath,
-                    filename=Path(content.FolderPath).name,
+                    filename=basename(content.FolderPath),
                     title=content.Title,
                     artist=None,  # Artist is a relationship, would need join
                     track_id=sp.ContentID
@@ -6,7 +6,8 @@
 """Real-DB backups: APFS-cheap, automatic, retained (editspace-migration 06).
 
 Backs up /Users/murtaza/manadj/data/library.db into data/backups/ as
-library-<UTC timestamp>.db via `cp -c` (APFS clone: instant, block-shared).
+library-<UTC timestamp>.db via SQLite's online backup API (`snapshot`): a
+consistent copy that includes commits still in the WAL file.
 Fires automatically from:
   - backend startup, BEFORE alembic upgrade (backend/main.py)
   - lane_app.py ensure_sandbox_db (every lane-app start = a backup point)
@@ -36,7 +37,7 @@ from __future__ import annotations
 
 import argparse
 import re
-import subprocess
+import sqlite3
 import sys
 import time
 from datetime import datetime, timezone
@@ -66,9 +67,31 @@ def _backups() -> list[tuple[float, Path]]:
     return sorted(out)
 
 
-def _clone(src: Path, dest: Path) -> None:
+def snapshot(src: Path, dest: Path) -> None:
+    """Copy a live DB to dest with SQLite's online backup API.
+
+    The app runs in WAL mode, so committed writes can still sit in the -wal
+    file; a file copy of the main .db alone would drop them. The backup API
+    reads through SQLite (main file + WAL) as one consistent snapshot, and
+    needs only read access to src — lane agents can't write the real DB.
+    Written to a temp name first, so a failed copy never looks like a backup
+    (or a sandbox DB).
+    """
     dest.parent.mkdir(parents=True, exist_ok=True)
-    subprocess.run(["cp", "-c", str(src), str(dest)], check=True)
+    tmp = dest.with_name(dest.name + ".tmp")
+    src_conn = sqlite3.connect(f"{src.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        dest_conn = sqlite3.connect(tmp)
+        try:
+            src_conn.backup(dest_conn)
+            # The copied header says WAL; make the snapshot a self-contained
+            # single file (the app switches it back to WAL on connect).
+            dest_conn.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            dest_conn.close()
+    finally:
+        src_conn.close()
+    tmp.replace(dest)
 
 
 def backup(force: bool = False, quiet: bool = False) -> Path | None:
@@ -83,7 +106,7 @@ def backup(force: bool = False, quiet: bool = False) -> Path | None:
         return None
     stamp = datetime.now(timezone.utc).strftime(STAMP)
     dest = BACKUP_DIR / f"library-{stamp}.db"
-    _clone(REAL_DB, dest)
+    snapshot(REAL_DB, dest)
     prune(quiet=quiet)
     if not quiet:
         print(f"db_backup: {dest}")
@@ -112,7 +135,7 @@ def harvest(path: Path) -> Path | None:
     if dest.exists():
         print(f"db_backup: {dest} already exists; skipped")
         return None
-    _clone(path, dest)
+    snapshot(path, dest)
     print(f"db_backup: harvested {path} -> {dest}")
     return dest
 
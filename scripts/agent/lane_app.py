@@ -117,9 +117,9 @@ def ensure_sandbox_db() -> None:
     import db_backup
 
     db_backup.maybe_backup()
-    db.parent.mkdir(parents=True, exist_ok=True)
-    subprocess.run(["cp", "-c", str(real), str(db)], check=True)
-    print(f"cloned sandbox DB (APFS) from {real}")
+    # Not a file copy: committed writes may still be in the real DB's WAL
+    db_backup.snapshot(real, db)
+    print(f"cloned sandbox DB from {real}")
 
 
 def ensure_frontend_deps() -> None:
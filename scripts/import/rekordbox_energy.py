@@ -17,6 +17,7 @@ Usage:
 
 import argparse
 from pathlib import Path
+from sqlalchemy import case, update
 from sqlalchemy.orm import Session
 from rekordbox import RekordboxReader
 from backend.database import SessionLocal
@@ -62,6 +63,13 @@ def import_energy_from_colors(dry_run: bool = False) -> dict:
     db = SessionLocal()
 
     try:
+        # One pass over the library instead of a SELECT per Rekordbox track
+        db_tracks = {
+            filename: {"id": track_id, "energy": energy}
+            for track_id, filename, energy in db.query(Track.id, Track.filename, Track.energy)
+        }
+        updates = []  # db_tracks entries to write, in one UPDATE
+
         for rb_track in rb_tracks:
             # Skip tracks without file paths
             if not rb_track.file_path:
@@ -80,7 +88,7 @@ def import_energy_from_colors(dry_run: bool = False) -> dict:
             energy_value = COLOR_TO_ENERGY[color_id]
 
             # Find track in database by filename
-            db_track = db.query(Track).filter(Track.filename == filename).first()
+            db_track = db_tracks.get(filename)
 
             if not db_track:
                 stats["db_tracks_not_found"] += 1
@@ -91,23 +99,34 @@ def import_energy_from_colors(dry_run: bool = False) -> dict:
             stats["db_tracks_found"] += 1
 
             # Check if track already has energy value
-            if db_track.energy is not None:
+            if db_track["energy"] is not None:
                 stats["tracks_skipped_has_energy"] += 1
                 if not dry_run:
-                    print(f"  Skipping (already has energy={db_track.energy}): {filename}")
+                    print(f"  Skipping (already has energy={db_track['energy']}): {filename}")
                 continue
 
             # Update energy value
             if dry_run:
                 print(f"  [DRY RUN] Would set energy={energy_value} (color={color_id}): {filename}")
             else:
-                db_track.energy = energy_value
+                db_track["energy"] = energy_value
+                updates.append(db_track)
                 print(f"  Setting energy={energy_value} (color={color_id}): {filename}")
 
             stats["tracks_updated"] += 1
 
         # Commit changes if not dry run
         if not dry_run:
+            if updates:
+                # One set-based UPDATE: each id picks its energy via CASE,
+                # and the NULL guard is re-checked in SQL at write time
+                energy_by_id = {u["id"]: u["energy"] for u in updates}
+                db.execute(
+                    update(Track)
+                    .where(Track.id.in_(energy_by_id), Track.energy.is_(None))
+                    .values(energy=case(energy_by_id, value=Track.id))
+                    .execution_options(synchronize_session=False)
+                )
             db.commit()
             print("\nChanges committed to database")
         else:
@@ -4,6 +4,7 @@
 import sys
 import argparse
 from pathlib import Path
+from sqlalchemy import Row, update
 from enginedj import EngineDJDatabase
 from backend.sync_common.matching import TrackIndex
 from enginedj.models.track import Track as EDJTrack
@@ -26,7 +27,7 @@ class SyncStats:
         self.not_in_engine = 0
 
 
-def prompt_conflict(db_track: DBTrack, db_key: Key, edj_key: Key, auto_mode: str | None) -> str:
+def prompt_conflict(db_track: Row, db_key: Key, edj_key: Key, auto_mode: str | None) -> str:
     """Prompt user to resolve a key conflict.
 
     Returns: 'keep', 'engine', 'skip', 'keep_all', or 'engine_all'
@@ -79,8 +80,11 @@ def sync_keys(engine_db_path: str, apply: bool = False, verbose: bool = False):
         print("Scanning tracks...")
 
         with edj_db.session_m() as edj_session:
-            # Get all tracks from our database
-            db_tracks = db.query(DBTrack).all()
+            # Get all tracks from our database — just the columns the sync
+            # reads, as plain rows (no ORM instances / identity map)
+            db_tracks = db.query(
+                DBTrack.id, DBTrack.filename, DBTrack.key, DBTrack.artist, DBTrack.title
+            ).all()
             stats.scanned = len(db_tracks)
 
             # Index the Engine DJ library once; match in memory
@@ -169,8 +173,11 @@ def sync_keys(engine_db_path: str, apply: bool = False, verbose: bool = False):
         # Apply updates
         if apply and updates:
             print(f"\nApplying {len(updates)} update(s)...")
-            for db_track, new_key_id, old_key, new_key in updates:
-                db_track.key = new_key_id
+            # One executemany UPDATE by primary key, not a flush per object
+            db.execute(
+                update(DBTrack),
+                [{"id": db_track.id, "key": new_key_id} for db_track, new_key_id, _, _ in updates],
+            )
             db.commit()
             print("✓ Changes committed to database")
 
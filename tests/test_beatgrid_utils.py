@@ -6,9 +6,15 @@ was wrong with linearly growing error, and client-side Quantize snapped to
 phantom beats. Constant grids must stay byte-identical (regression).
 """
 
+import json
+
 from backend.beatgrid_utils import (
     _downbeat_times,
     calculate_beats_from_tempo_changes,
+    calculate_beats_from_tempo_changes_json,
+    generate_beatgrid_from_bpm,
+    nudge_beatgrid,
+    set_downbeat_at_time,
 )
 
 
@@ -104,3 +110,56 @@ class TestDownbeatDerivationsAgree:
         reanchor_downbeats = _downbeat_times(grid, until=100.0)
         shared = [d for d in reanchor_downbeats if d <= expansion_downbeats[-1]]
         assert shared == expansion_downbeats
+
+
+class TestPlaceholderGridCache:
+    def test_cached_grid_is_not_shared_between_callers(self):
+        first = generate_beatgrid_from_bpm(128.0, 30.0)
+        first["beat_times"].append(999.0)
+        first["downbeat_times"].clear()
+        second = generate_beatgrid_from_bpm(128.0, 30.0)
+        assert second["beat_times"][-1] != 999.0
+        assert second["downbeat_times"]
+        assert second["beat_times"] == calculate_beats_from_tempo_changes(
+            [tc(0.0, 128.0)], 30.0
+        )[0]
+
+
+class TestStoredGridCache:
+    def test_matches_expansion_and_is_not_shared_between_callers(self):
+        grid = [tc(0.0, 120.0), tc(60.0, 150.0)]
+        stored = json.dumps(grid)
+        first = calculate_beats_from_tempo_changes_json(stored, 100.0)
+        assert first == calculate_beats_from_tempo_changes(grid, 100.0)
+        first[0].append(999.0)
+        assert calculate_beats_from_tempo_changes_json(stored, 100.0)[0][-1] != 999.0
+
+    def test_edited_grid_is_a_new_key(self):
+        before = calculate_beats_from_tempo_changes_json(json.dumps([tc(0.0, 120.0)]), 10.0)
+        after = calculate_beats_from_tempo_changes_json(json.dumps([tc(0.1, 120.0)]), 10.0)
+        assert after[0][0] == before[0][0] + 0.1
+
+
+class TestSetDownbeat:
+    def test_bar_position_counts_back_from_user_downbeat(self):
+        # 120 BPM: 0.5s beats; the user's downbeat is 0..4 beats past t=0.1
+        expected = {0: 1, 1: 4, 2: 3, 3: 2, 4: 1}
+        for num_beats_back, bar_position in expected.items():
+            (change,) = set_downbeat_at_time(0.1 + num_beats_back * 0.5, 120.0)
+            assert change["bar_position"] == bar_position
+            assert abs(change["start_time"] - 0.1) < 1e-9
+
+
+class TestNudge:
+    def test_zero_offset_returns_grid_unchanged(self):
+        grid = [tc(0.5, 120.0), tc(60.0, 150.0)]
+        new_grid, applied = nudge_beatgrid(grid, 0.0, 300.0)
+        assert applied == 0.0
+        assert new_grid == grid
+        assert new_grid is not grid
+
+    def test_fully_clamped_nudge_is_a_no_op(self):
+        grid = [tc(-0.1, 120.0)]
+        new_grid, applied = nudge_beatgrid(grid, -50.0, 300.0)
+        assert applied == 0.0
+        assert new_grid == grid
@@ -11,6 +11,7 @@ anchor with the grid.
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from backend import crud
@@ -373,3 +374,29 @@ def test_bpm_edit_without_grid_is_a_plain_metadata_write(client, make_track, db_
     assert resp.status_code == 200, resp.text
     assert resp.json()["bpm"] == 150.0
     assert db_session.query(Beatgrid).filter_by(track_id=track.id).first() is None
+
+
+def test_get_reads_track_waveform_and_grid_in_one_query(
+    client, make_track, make_waveform, db_session
+):
+    track = make_track(bpm=12800)
+    make_waveform(track.id, duration=30.0)
+    crud.update_beatgrid_tempo_changes(db_session, track.id, [tc(0.0, 128.0)])
+    track_id = track.id
+    db_session.expire_all()
+
+    statements: list[str] = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db_session.bind, "before_cursor_execute", listener)
+    try:
+        resp = client.get(f"/api/beatgrids/{track_id}")
+    finally:
+        event.remove(db_session.bind, "before_cursor_execute", listener)
+
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["data"]["beat_times"][:2] == [0.0, 60.0 / 128.0]
+    assert len(statements) == 1
+    assert "data_blob" not in statements[0]
@@ -40,6 +40,13 @@ class TestConstruction:
     def test_from_musical_accepts_long_form(self):
         assert Key.from_musical("F Minor") == Key.from_musical("Fm")
 
+    @pytest.mark.parametrize(
+        "spelling,musical",
+        [("c#min", "C#m"), ("Fmaj", "F"), ("a MINOR", "Am"), ("ebm", "D#m"), (" Gb major ", "F#")],
+    )
+    def test_from_musical_normalizes_free_form_spellings(self, spelling, musical):
+        assert Key.from_musical(spelling).musical == musical
+
     def test_from_musical_invalid(self):
         assert Key.from_musical("H#") is None
         assert Key.from_musical("") is None
@@ -121,3 +128,11 @@ class TestEquality:
 
     def test_not_equal_to_non_key(self):
         assert Key.from_engine_id(5) != 5
+
+    def test_constructors_share_one_instance_per_key(self):
+        key = Key.from_engine_id(1)
+        assert Key.from_musical("Am") is key
+        assert Key.from_musical("1m") is key
+        assert Key.from_musical("8A") is key
+        assert Key.from_musical("A Minor") is key
+        assert Key.from_mixxx_id(22) is key
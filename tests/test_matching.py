@@ -7,10 +7,11 @@ canonical semantics that five duplicated implementations used to disagree on.
 """
 
 from dataclasses import dataclass
+from pathlib import Path
 
 import pytest
 
-from backend.sync_common.matching import TrackIndex, find_unmatched
+from backend.sync_common.matching import TrackIndex, basename, find_unmatched
 
 
 @dataclass
@@ -80,3 +81,10 @@ class TestFindUnmatched:
     def test_pathless_source_rows_are_unmatched(self, index):
         rows = [Row(None, "pathless")]
         assert [r.label for r in find_unmatched(rows, path_of, index)] == ["pathless"]
+
+
+@pytest.mark.parametrize(
+    "path", ["/music/a.mp3", "/music/sub dir/b.flac", "relative/c.wav", "d.aiff", ""]
+)
+def test_basename_agrees_with_path_name(path):
+    assert basename(path) == Path(path).name
@@ -0,0 +1,42 @@
+"""Migration 0030: existing Waveform data blobs get their content digest
+(the ETag the waveform endpoint serves) backfilled; blobless rows stay NULL.
+"""
+
+from pathlib import Path
+
+from alembic import command as alembic_command
+from alembic.config import Config as AlembicConfig
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from backend.models import waveform_blob_digest
+
+ALEMBIC_INI = Path(__file__).parent.parent / "alembic.ini"
+
+
+def test_0030_backfills_digests_of_existing_blobs():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    with engine.connect() as connection:
+        cfg = AlembicConfig(str(ALEMBIC_INI))
+        cfg.attributes["connection"] = connection
+        cfg.attributes["configure_logger"] = False
+
+        alembic_command.upgrade(cfg, "0029_hdwqzkrm")
+        connection.execute(text("INSERT INTO tracks (id, filename) VALUES (1, '/a.mp3'), (2, '/b.mp3')"))
+        connection.execute(
+            text(
+                "INSERT INTO waveforms (track_id, sample_rate, duration, samples_per_peak, data_blob) "
+                "VALUES (1, 44100, 2.0, 512, :blob), (2, 44100, 2.0, 512, NULL)"
+            ),
+            {"blob": b"MWF1-blob"},
+        )
+        connection.commit()
+
+        alembic_command.upgrade(cfg, "head")
+
+        digests = dict(connection.execute(text("SELECT track_id, data_digest FROM waveforms")).all())
+        assert digests == {1: waveform_blob_digest(b"MWF1-blob"), 2: None}
@@ -0,0 +1,45 @@
+"""are_playlists_equivalent: two-tier Match over playlist_b, position by
+position. The identical-prefix shortcut must agree with matching against
+the whole of playlist_b, including playlists that repeat a track.
+"""
+
+from backend.playlists.comparison import are_playlists_equivalent
+from backend.playlists.models import PlaylistInfo, TrackReference
+from backend.sync_common.matching import TrackIndex
+
+
+def _playlist(*paths: str) -> PlaylistInfo:
+    return PlaylistInfo(
+        name="Set",
+        tracks=[TrackReference(path=p, filename=p.rsplit("/", 1)[-1]) for p in paths],
+        source="manadj", source_id=1, hierarchy_parts=None, last_modified=None,
+    )
+
+
+def _full_index_equivalent(a: PlaylistInfo, b: PlaylistInfo) -> bool:
+    if len(a.tracks) != len(b.tracks):
+        return False
+    index_b = TrackIndex.build(b.tracks, lambda t: t.path)
+    return all(index_b.match(ta.path) == tb for ta, tb in zip(a.tracks, b.tracks))
+
+
+def test_repeated_prefix_path_does_not_fall_through_to_basename():
+    # a's second P exact-matches b's first P, not Q at the same position
+    a = _playlist("/lib/p.mp3", "/lib/p.mp3")
+    b = _playlist("/lib/p.mp3", "/usb/p.mp3")
+    assert are_playlists_equivalent(a, b) is False
+
+
+def test_agrees_with_matching_against_the_whole_playlist():
+    cases = [
+        (("/lib/p.mp3", "/lib/p.mp3"), ("/lib/p.mp3", "/usb/p.mp3")),
+        (("/lib/p.mp3", "/lib/p.mp3"), ("/lib/p.mp3", "/lib/p.mp3")),
+        (("/lib/p.mp3", "/usb/p.mp3"), ("/lib/p.mp3", "/lib/p.mp3")),
+        (("/lib/a.mp3", "/lib/b.mp3"), ("/lib/a.mp3", "../Music/b.mp3")),
+        (("/lib/a.mp3", "/lib/b.mp3", "/lib/a.mp3"), ("/lib/a.mp3", "/usb/b.mp3", "/usb/a.mp3")),
+        (("/lib/a.mp3", "/lib/b.mp3"), ("/lib/a.mp3", "/lib/c.mp3")),
+        (("/lib/a.mp3", ""), ("/lib/a.mp3", "")),
+    ]
+    for paths_a, paths_b in cases:
+        a, b = _playlist(*paths_a), _playlist(*paths_b)
+        assert are_playlists_equivalent(a, b) is _full_index_equivalent(a, b), (paths_a, paths_b)
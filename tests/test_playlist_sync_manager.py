@@ -0,0 +1,224 @@
+"""PlaylistSyncManager: matching a source playlist onto a target library.
+
+The target-side index is built from targeted queries rather than the whole
+table; it must match exactly as a TrackIndex over every target row would.
+"""
+
+import threading
+import time
+
+from sqlalchemy import Column, String, create_engine
+from sqlalchemy.orm import DeclarativeBase, Session
+
+from backend.models import Playlist, PlaylistTrack, Track
+from backend.playlists.comparison import are_playlists_equivalent
+from backend.playlists.models import MatchedTriple, PlaylistInfo, SyncResult, TrackReference
+from backend.playlists.sync_manager import PlaylistSyncManager
+from backend.sync_common.matching import TrackIndex
+from enginedj.models.playlist import Playlist as EDJPlaylist
+
+from .test_engine_tag_energy import InMemoryEngineDB
+
+
+def _ref(path: str) -> TrackReference:
+    return TrackReference(path=path, filename=path.rsplit("/", 1)[-1])
+
+
+def test_target_index_matches_like_a_full_table_index(db, make_track):
+    make_track(filename="/lib/a.mp3")
+    make_track(filename="/lib/old/b.mp3")
+    make_track(filename="/lib/new/b.mp3")  # later row wins the basename tier
+    make_track(filename="/lib/c.mp3")
+    make_track(filename="/lib/unrelated.mp3")
+    refs = [
+        _ref("/lib/a.mp3"),         # exact path
+        _ref("/usb/b.mp3"),         # basename only, duplicated in the target
+        _ref("/lib/old/b.mp3"),     # exact path beats the basename winner
+        _ref("../Music/c.mp3"),     # relative Engine-style path
+        _ref("/usb/missing.mp3"),   # no match
+    ]
+
+    full = TrackIndex.build(db.query(Track).all(), lambda t: t.filename)
+    targeted = PlaylistSyncManager(db)._target_index("manadj", db, Track, "filename", "id", refs)
+
+    assert [targeted.match(r.path) for r in refs] == [full.match(r.path) for r in refs]
+    assert len(targeted.by_path) + len(targeted.by_filename) < db.query(Track).count()
+
+
+def test_sync_to_manadj_resolves_tracks_by_path_then_filename(db, make_track):
+    a = make_track(filename="/lib/a.mp3")
+    b = make_track(filename="/lib/b.mp3")
+    manager = PlaylistSyncManager(db)
+
+    matched, unmatched = manager._match_tracks_to_manadj(
+        [_ref("/lib/a.mp3"), _ref("../Music/b.mp3"), _ref("/usb/gone.mp3")]
+    )
+
+    assert [t.id for t in matched] == [a.id, b.id]
+    assert unmatched == ["gone.mp3"]
+
+
+def test_basename_scan_runs_once_per_target(db, make_track):
+    make_track(filename="/lib/a.mp3")
+    manager = PlaylistSyncManager(db)
+    manager._match_tracks_to_manadj([_ref("/usb/a.mp3")])
+
+    late = make_track(filename="/lib/late.mp3")
+    matched, unmatched = manager._match_tracks_to_manadj([_ref("/usb/a.mp3"), _ref(late.filename)])
+
+    # The memoized basename map is reused; exact paths are always queried
+    assert list(manager._basename_ids) == ["manadj"]
+    assert "late.mp3" not in manager._basename_ids["manadj"]
+    assert [t.filename for t in matched] == ["/lib/a.mp3", "/lib/late.mp3"]
+    assert unmatched == []
+
+
+def _playlist(source: str, *paths: str) -> PlaylistInfo:
+    return PlaylistInfo(
+        name="Set", tracks=[_ref(p) for p in paths], source=source,
+        source_id=1, hierarchy_parts=None, last_modified=None,
+    )
+
+
+def test_check_if_synced_agrees_with_pairwise_equivalence(db):
+    manager = PlaylistSyncManager(db)
+    cases = [
+        (("/lib/a.mp3", "/lib/b.mp3"), ("../Music/a.mp3", "../Music/b.mp3")),
+        (("/lib/a.mp3", "/lib/b.mp3"), ("../Music/b.mp3", "../Music/a.mp3")),
+        (("/lib/a.mp3",), ("/lib/a.mp3", "/lib/b.mp3")),
+        (("/lib/a.mp3", ""), ("/lib/a.mp3", "")),
+        # Repeated basenames: settled by exact paths, not the key alone
+        (("/x/s.mp3", "/y/s.mp3"), ("/y/s.mp3", "/x/s.mp3")),
+        (("/x/s.mp3", "/y/s.mp3"), ("/x/s.mp3", "/y/s.mp3")),
+    ]
+    for paths_a, paths_b in cases:
+        a, b = _playlist("manadj", *paths_a), _playlist("engine", *paths_b)
+        expected = are_playlists_equivalent(a, b)
+        assert manager._check_if_synced(MatchedTriple(a, b, None)) is expected, (paths_a, paths_b)
+
+
+def test_sync_to_all_runs_targets_concurrently_in_target_order(db, monkeypatch):
+    manager = PlaylistSyncManager(db)
+    manager.engine_db = manager.rb_db = object()  # only their presence matters here
+    both_running = threading.Barrier(2, timeout=5)
+
+    def fake_sync(playlist_name, source, target, ignore_missing_tracks, dry_run):
+        both_running.wait()  # raises BrokenBarrierError if run one at a time
+        if target == "engine":
+            time.sleep(0.05)  # finish last; results must still follow target order
+        return SyncResult(target=target, success=True, created=False, tracks_synced=0, tracks_unmatched=[])
+
+    monkeypatch.setattr(manager, "sync_playlist_to_target", fake_sync)
+
+    results = manager.sync_playlist_to_all("Set", source="manadj")
+
+    assert [r.target for r in results] == ["engine", "rekordbox"]
+
+
+def test_sync_to_manadj_creates_then_replaces_entries(db, make_track):
+    a, b, c = (make_track(filename=f"/lib/{n}.mp3") for n in "abc")
+    manager = PlaylistSyncManager(db)
+
+    assert manager._sync_to_manadj("Set", [a, b]) == (True, True)
+    assert manager._sync_to_manadj("Set", [c, a]) == (True, False)
+
+    playlist = db.query(Playlist).filter(Playlist.name == "Set").one()
+    rows = db.query(PlaylistTrack).filter(PlaylistTrack.playlist_id == playlist.id)
+    assert [(pt.position, pt.track_id) for pt in rows.order_by(PlaylistTrack.position)] == [(0, c.id), (1, a.id)]
+
+
+def test_sync_to_engine_writes_parents_and_leaf_in_one_session(db):
+    edb = InMemoryEngineDB()
+    write_sessions = 0
+    open_write = edb.session_m_write
+
+    def counting_write():
+        nonlocal write_sessions
+        write_sessions += 1
+        return open_write()
+
+    edb.session_m_write = counting_write
+    manager = PlaylistSyncManager(db, engine_db=edb)
+
+    assert manager._sync_to_engine("Crate > Sub > Set", []) == (True, True)
+
+    assert write_sessions == 1
+    with edb.session_m() as s:
+        crate = s.query(EDJPlaylist).filter_by(title="Crate").one()
+        sub = s.query(EDJPlaylist).filter_by(title="Sub", parentListId=crate.id).one()
+        assert s.query(EDJPlaylist).filter_by(title="Set", parentListId=sub.id).count() == 1
+
+
+def test_stats_and_unified_view_share_one_name_match(db, monkeypatch):
+    import backend.playlists.sync_manager as sync_manager
+
+    calls = []
+    real_match = sync_manager.match_playlists_by_name
+    monkeypatch.setattr(sync_manager, "match_playlists_by_name", lambda p: calls.append(1) or real_match(p))
+    db.add(Playlist(name="Set"))
+    db.commit()
+    manager = PlaylistSyncManager(db)
+
+    manager.get_unified_view()
+    manager.get_stats()
+    assert len(calls) == 1
+
+    manager.sync_playlist_to_target("Set", source="manadj", target="manadj", dry_run=True)
+    manager.get_stats()
+    assert len(calls) == 1
+
+    # A write drops the target's snapshot, and the match with it
+    manager.sync_playlist_to_target("Set", source="manadj", target="manadj")
+    assert manager.get_stats().manadj_playlists_loaded == 1
+    assert len(calls) == 2
+
+
+def test_sync_finds_the_first_source_playlist_with_the_name(db, make_track):
+    a = make_track(filename="/lib/a.mp3")
+    make_track(filename="/lib/b.mp3")
+    first = PlaylistInfo(name="Set", tracks=[_ref("/lib/a.mp3")], source="engine",
+                         source_id=1, hierarchy_parts=None, last_modified=None)
+    second = PlaylistInfo(name="Set", tracks=[_ref("/lib/b.mp3")], source="engine",
+                          source_id=2, hierarchy_parts=None, last_modified=None)
+    manager = PlaylistSyncManager(db)
+    manager._playlists["engine"] = [first, second]
+
+    result = manager.sync_playlist_to_target("Set", source="engine", target="manadj")
+
+    assert result.success and result.tracks_synced == 1
+    playlist = db.query(Playlist).filter(Playlist.name == "Set").one()
+    assert [pt.track_id for pt in playlist.playlist_tracks] == [a.id]
+
+
+class _TextIdBase(DeclarativeBase):
+    pass
+
+
+class _TextIdTrack(_TextIdBase):
+    """Rekordbox-shaped target: text primary key, paths not unique."""
+    __tablename__ = "content"
+    ID = Column(String, primary_key=True)
+    FolderPath = Column(String)
+
+
+def test_target_index_ties_break_in_rowid_order_not_text_id_order(db):
+    engine = create_engine("sqlite://")
+    _TextIdBase.metadata.create_all(engine)
+    with Session(engine) as rb:
+        # Inserted (rowid) order 9, 10, 8, 7; as text, "10" sorts before "9"
+        rb.add_all([
+            _TextIdTrack(ID="9", FolderPath="/rb/a/s.mp3"),
+            _TextIdTrack(ID="10", FolderPath="/rb/b/s.mp3"),  # last "s.mp3" by rowid
+            _TextIdTrack(ID="8", FolderPath="/rb/dup.mp3"),
+            _TextIdTrack(ID="7", FolderPath="/rb/dup.mp3"),   # last "/rb/dup.mp3" by rowid
+        ])
+        rb.commit()
+        refs = [_ref("/usb/s.mp3"), _ref("/rb/dup.mp3")]
+
+        full = TrackIndex.build(rb.query(_TextIdTrack).all(), lambda t: t.FolderPath)
+        targeted = PlaylistSyncManager(db)._target_index(
+            "rekordbox", rb, _TextIdTrack, "FolderPath", "ID", refs
+        )
+
+        assert [targeted.match(r.path).ID for r in refs] == ["10", "7"]
+        assert [targeted.match(r.path) for r in refs] == [full.match(r.path) for r in refs]
@@ -20,6 +20,7 @@ from backend.track_metadata import (
     centibpm_to_bpm,
     compare_with_files,
     read_file_metadata,
+    read_file_metadata_many,
     refresh_from_files,
     sync_to_db,
     write_file_metadata,
@@ -93,6 +94,23 @@ class TestFileMetadata:
         meta = read_file_metadata(path)
         assert (meta.title, meta.artist, meta.bpm) == ("Keep", "Me", 140.0)
 
+    def test_cached_read_is_not_shared_and_sees_writes(self, audio_file):
+        path = audio_file("mp3")
+        write_file_metadata(path, title="Before")
+        first = read_file_metadata(path)
+        first.title = "mutated"
+        assert read_file_metadata(path).title == "Before"
+        write_file_metadata(path, title="After")
+        assert read_file_metadata(path).title == "After"
+
+    def test_read_many_keeps_order_and_returns_errors_in_place(self, audio_file, tmp_path):
+        tagged = audio_file("mp3")
+        write_file_metadata(tagged, title="First")
+        results = read_file_metadata_many([tagged, tmp_path / "nope.mp3", audio_file("flac")])
+        assert results[0].title == "First"
+        assert isinstance(results[1], FileMetadataError)
+        assert results[2].title is None
+
 
 class TestApplyUpdate:
     def test_bpm_stored_as_centibpm(self, db, make_track):
@@ -62,3 +62,33 @@ def test_sort_by_provenance_label(
 
     items, _, _ = crud.get_tracks(db_session, sort_column="provenance", sort_direction="asc")
     assert [t.title for t in items] == ["B", "A"]
+
+
+def test_any_tag_filter_counts_each_track_once(
+    db_session: Session, make_track: Callable[..., Track]
+) -> None:
+    from backend.models import Tag, TagCategory, TrackTag
+
+    category = TagCategory(name="Genre")
+    db_session.add(category)
+    db_session.flush()
+    house = Tag(name="House", category_id=category.id)
+    techno = Tag(name="Techno", category_id=category.id)
+    db_session.add_all([house, techno])
+    db_session.flush()
+
+    both = make_track(title="Both")
+    make_track(title="Untagged")
+    db_session.add_all([
+        TrackTag(track_id=both.id, tag_id=house.id),
+        TrackTag(track_id=both.id, tag_id=techno.id),
+    ])
+    db_session.commit()
+
+    items, total, library_total = crud.get_tracks(
+        db_session, tag_ids=[house.id, techno.id], limit=1
+    )
+    assert total == 1
+    assert [t.title for t in items] == ["Both"]
+    assert sorted(t.name for t in items[0].tags) == ["House", "Techno"]
+    assert library_total == 2
@@ -26,6 +26,7 @@ from backend.waveform_data import (
     SAMPLE_RATE,
     STFT_WINDOW,
     FORMAT_VERSION,
+    analyze,
     decode_blob,
     generate_blob,
 )
@@ -103,6 +104,15 @@ def test_missing_file_raises():
         generate_blob(str(FIXTURES / "does_not_exist.wav"))
 
 
+def test_parallel_band_analysis_matches_serial():
+    path = str(FIXTURES / "impulse.wav")
+    p_peaks, p_bands, p_dur = analyze(path, parallel=True)
+    s_peaks, s_bands, s_dur = analyze(path, parallel=False)
+    assert np.array_equal(p_peaks, s_peaks)
+    assert np.array_equal(p_bands, s_bands)
+    assert p_dur == s_dur
+
+
 # ------------------------------------------------------------------ endpoint
 
 
@@ -111,6 +121,8 @@ def client(db):
     app = FastAPI()
     app.include_router(waveforms_router.router, prefix="/api/waveforms")
     app.dependency_overrides[get_db] = lambda: db
+    # Each test's in-memory DB restarts ids; don't serve another test's blob.
+    waveforms_router._blob_cache.clear()
     return TestClient(app)
 
 
@@ -145,6 +157,50 @@ def test_endpoint_serves_blob_with_immutable_caching(db, client, make_track):
     assert r2.status_code == 304
 
 
+def test_endpoint_serves_rewritten_blob_not_cached_one(db, client, make_track):
+    track = make_track()
+    _seed_waveform(db, track, b"first")
+    r1 = client.get(f"/api/waveforms/{track.id}/data")
+    assert r1.content == b"first"
+    assert client.get(f"/api/waveforms/{track.id}/data").content == b"first"  # cache hit
+
+    waveform = db.query(models.Waveform).filter_by(track_id=track.id).one()
+    waveform.data_blob = b"regenerated"
+    db.commit()
+
+    r2 = client.get(f"/api/waveforms/{track.id}/data")
+    assert r2.content == b"regenerated"
+    assert r2.headers["etag"] != r1.headers["etag"]
+
+
+def test_endpoint_serves_same_length_rewrite_within_the_second(db, client, make_track):
+    """Re-analysis often writes a blob of the same length, within the same
+    updated_at second: only the content digest tells the versions apart."""
+    track = make_track()
+    _seed_waveform(db, track, b"first")
+    r1 = client.get(f"/api/waveforms/{track.id}/data")
+
+    waveform = db.query(models.Waveform).filter_by(track_id=track.id).one()
+    waveform.data_blob = b"frist"
+    db.commit()
+
+    r2 = client.get(f"/api/waveforms/{track.id}/data", headers={"If-None-Match": r1.headers["etag"]})
+    assert r2.status_code == 200
+    assert r2.content == b"frist"
+    assert r2.headers["etag"] != r1.headers["etag"]
+
+
+def test_endpoint_derives_missing_digest_from_the_blob(db, client, make_track):
+    track = make_track()
+    _seed_waveform(db, track, b"first")
+    db.query(models.Waveform).filter_by(track_id=track.id).update({"data_digest": None})
+    db.commit()
+
+    r = client.get(f"/api/waveforms/{track.id}/data")
+    assert r.content == b"first"
+    assert r.headers["etag"] == f'"{models.waveform_blob_digest(b"first")}"'
+
+
 def test_endpoint_404s(db, client, make_track):
     r = client.get("/api/waveforms/99999/data")
     assert r.status_code == 404